@@ -1,13 +1,42 @@
 #!/usr/bin/env python3
 import os
 import sys
-import time
+import gzip
 import json
+import platform
 import uuid
 import yaml
+import copy
+import asyncio
 import logging
-import requests
+import aiohttp
+import threading
 from datetime import datetime
+from collections import OrderedDict
+
+# orjson parses and serializes several times faster than stdlib json and
+# dumps straight to bytes; fall back to stdlib when it isn't installed
+try:
+    import orjson
+
+    def _dumps(payload):
+        """Serialize a payload to compact JSON bytes"""
+        return orjson.dumps(payload)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(payload):
+        """Serialize a payload to compact JSON bytes"""
+        return json.dumps(payload, separators=(',', ':')).encode()
+
+    _loads = json.loads
+
+# Prefer the LibYAML C implementations when PyYAML was built with them;
+# they parse and serialize several times faster than the pure-Python ones
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
 
 # Import from local modules
 from utils.logging_config import setup_logging, get_logger
@@ -17,11 +46,63 @@ from scanners import get_scanner, list_available_scanners
 # Setup logging
 logger = setup_logging()
 
+# Cache of parsed config files keyed by path, invalidated when the file's
+# (mtime_ns, size, inode) signature changes. Avoids re-parsing YAML when
+# agents are constructed repeatedly (e.g. restarts, tests).
+_CONFIG_CACHE = OrderedDict()
+_CONFIG_CACHE_MAX = 100
+_config_cache_lock = threading.Lock()
+
+def _load_yaml_config(path):
+    """
+    Load and parse a YAML config file, caching the parsed dict
+
+    Args:
+        path (str): Path to the YAML file
+
+    Returns:
+        dict: Parsed configuration (a copy, safe for the caller to mutate)
+    """
+    st = os.stat(path)
+    signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    with _config_cache_lock:
+        cached = _CONFIG_CACHE.get(path)
+        if cached is not None and cached[0] == signature:
+            _CONFIG_CACHE.move_to_end(path)
+            return copy.deepcopy(cached[1])
+
+    with open(path, 'r') as f:
+        config = yaml.load(f, Loader=SafeLoader)
+
+    with _config_cache_lock:
+        _CONFIG_CACHE[path] = (signature, config)
+        _CONFIG_CACHE.move_to_end(path)
+        while len(_CONFIG_CACHE) > _CONFIG_CACHE_MAX:
+            _CONFIG_CACHE.popitem(last=False)
+
+    return copy.deepcopy(config)
+
+def _gzip_json(payload):
+    """
+    Serialize a payload to compact JSON and gzip it
+
+    SARIF-heavy result bodies compress 10-20x, which dominates upload time
+    for large scans.
+
+    Args:
+        payload (dict): JSON-serializable payload
+
+    Returns:
+        bytes: Gzipped JSON body
+    """
+    return gzip.compress(_dumps(payload))
+
 class SastAgent:
     def __init__(self, console_url, agent_name=None, default_timeout=3600, scanner_paths=None):
         """
         Initialize the SAST agent
-        
+
         Args:
             console_url (str): URL of the SAST console
             agent_name (str): Name of the agent (default: auto-generated)
@@ -39,16 +120,27 @@ class SastAgent:
         self.scanner_paths = scanner_paths or {}
         self.repository = Repository(clone_timeout=300)
         self.config_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "config.yaml")
-        
+        self._session = None  # aiohttp.ClientSession, created inside the event loop in run()
+        self._out_queue = None  # asyncio.Queue of console-bound events, created in run()
+        self._batch_events_supported = True
+        self._system_info = None  # Filled lazily by get_system_info
+
         # Try to load existing config if available
         self.load_config()
-        
+
+        # Agent-scoped endpoint URLs are fixed once the agent id is known;
+        # build them once instead of re-formatting per request
+        self._url_register = f"{self.console_url}/api/agents/register"
+        self._url_heartbeat = f"{self.console_url}/api/agents/{self.agent_id}/heartbeat"
+        self._url_tasks = f"{self.console_url}/api/agents/{self.agent_id}/tasks"
+        self._url_events = f"{self.console_url}/api/agents/{self.agent_id}/events"
+        self._url_ws = f"{self.console_url}/api/agents/{self.agent_id}/ws"
+
     def load_config(self):
         """Load configuration from file if it exists"""
         if os.path.exists(self.config_path):
             try:
-                with open(self.config_path, 'r') as f:
-                    config = yaml.safe_load(f)
+                config = _load_yaml_config(self.config_path)
                 self.agent_id = config.get('agent_id', self.agent_id)
                 self.agent_name = config.get('agent_name', self.agent_name)
                 self.registered = config.get('registered', False)
@@ -57,7 +149,7 @@ class SastAgent:
                 logger.info(f"Loaded configuration for agent {self.agent_name}")
             except Exception as e:
                 logger.error(f"Error loading config: {e}")
-        
+
     def save_config(self):
         """Save configuration to file"""
         config = {
@@ -70,22 +162,22 @@ class SastAgent:
         }
         try:
             with open(self.config_path, 'w') as f:
-                yaml.dump(config, f)
+                yaml.dump(config, f, Dumper=SafeDumper)
             logger.info(f"Saved configuration for agent {self.agent_name}")
         except Exception as e:
             logger.error(f"Error saving config: {e}")
-        
-    def register(self):
+
+    async def register(self):
         """
         Register the agent with the console
-        
+
         Returns:
             bool: True if registration was successful, False otherwise
         """
         if self.registered:
             logger.info(f"Agent {self.agent_name} already registered")
             return True
-        
+
         registration_data = {
             "agent_id": self.agent_id,
             "agent_name": self.agent_name,
@@ -93,150 +185,140 @@ class SastAgent:
             "status": self.status,
             "system_info": self.get_system_info()
         }
-        
+
         try:
-            # 添加时间戳参数以防止缓存
-            timestamp = int(time.time())
-            response = requests.post(
-                f"{self.console_url}/api/agents/register?t={timestamp}",
-                json=registration_data,
-                headers={
-                    "Cache-Control": "no-cache, no-store, must-revalidate",
-                    "Pragma": "no-cache"
-                },
-                timeout=30
-            )
-            
-            if response.status_code == 200:
-                # 检查响应内容而不仅仅是状态码
-                response_data = response.json()
-                if response_data.get('success'):
-                    self.registered = True
-                    logger.info(f"Successfully registered agent {self.agent_name}")
-                    self.save_config()
-                    return True
+            async with self._session.post(
+                self._url_register,
+                data=_dumps(registration_data),
+                headers={"Content-Type": "application/json"}
+            ) as response:
+                if response.status == 200:
+                    # 检查响应内容而不仅仅是状态码
+                    response_data = await response.json(loads=_loads)
+                    if response_data.get('success'):
+                        self.registered = True
+                        logger.info(f"Successfully registered agent {self.agent_name}")
+                        self.save_config()
+                        return True
+                    else:
+                        logger.error(f"Failed to register agent. Response: {await response.text()}")
+                        return False
                 else:
-                    logger.error(f"Failed to register agent. Response: {response.text}")
+                    logger.error(f"Failed to register agent. Status: {response.status}, Response: {await response.text()}")
                     return False
-            else:
-                logger.error(f"Failed to register agent. Status: {response.status_code}, Response: {response.text}")
-                return False
-                
+
         except Exception as e:
             logger.error(f"Error during registration: {e}")
             return False
-            
+
     def get_system_info(self):
         """
         Get basic system information
-        
+
+        The values are constant for the life of the process, so they are
+        gathered once and cached.
+
         Returns:
             dict: System information
         """
-        import platform
-        return {
-            "platform": platform.platform(),
-            "python": platform.python_version(),
-            "hostname": platform.node(),
-            "scanners": self.capabilities
-        }
-        
-    def heartbeat(self):
+        if self._system_info is None:
+            self._system_info = {
+                "platform": platform.platform(),
+                "python": platform.python_version(),
+                "hostname": platform.node(),
+                "scanners": self.capabilities
+            }
+        return self._system_info
+
+    async def heartbeat(self):
         """
         Send heartbeat to console to indicate agent is alive
-        
+
         Returns:
             bool: True if heartbeat was successful, False otherwise
         """
         if not self.registered:
             logger.warning("Agent not registered. Cannot send heartbeat.")
             return False
-            
+
         heartbeat_data = {
             "agent_id": self.agent_id,
             "status": self.status,
             "current_task": self.current_task,
             "timestamp": datetime.now().isoformat()
         }
-        
+
         try:
-            # 添加时间戳参数以防止缓存
-            timestamp = int(time.time())
-            response = requests.post(
-                f"{self.console_url}/api/agents/{self.agent_id}/heartbeat?t={timestamp}",
-                json=heartbeat_data,
-                headers={
-                    "Cache-Control": "no-cache, no-store, must-revalidate",
-                    "Pragma": "no-cache"
-                },
-                timeout=10
-            )
-            
-            if response.status_code == 200:
-                response_data = response.json()
-                if response_data.get('success'):
-                    logger.debug(f"Heartbeat sent successfully")
-                    return True
+            async with self._session.post(
+                self._url_heartbeat,
+                data=_dumps(heartbeat_data),
+                headers={"Content-Type": "application/json"},
+                timeout=aiohttp.ClientTimeout(total=10)
+            ) as response:
+                if response.status == 200:
+                    response_data = await response.json(loads=_loads)
+                    if response_data.get('success'):
+                        logger.debug(f"Heartbeat sent successfully")
+                        return True
+                    else:
+                        logger.warning(f"Failed to send heartbeat. Response: {await response.text()}")
+                        return False
                 else:
-                    logger.warning(f"Failed to send heartbeat. Response: {response.text}")
+                    logger.warning(f"Failed to send heartbeat. Status: {response.status}")
                     return False
-            else:
-                logger.warning(f"Failed to send heartbeat. Status: {response.status_code}")
-                return False
-                
+
         except Exception as e:
             logger.error(f"Error sending heartbeat: {e}")
             return False
-    
-    def poll_for_tasks(self):
+
+    async def poll_for_tasks(self):
         """
         Poll the console for new tasks
-        
+
         Returns:
             dict: Task data or None if no tasks are available
         """
         if not self.registered:
             logger.warning("Agent not registered. Cannot poll for tasks.")
             return None
-            
+
         if self.status != "idle":
             logger.debug(f"Agent is {self.status}. Skipping task poll.")
             return None
-            
+
         try:
-            response = requests.get(
-                f"{self.console_url}/api/agents/{self.agent_id}/tasks",
+            async with self._session.get(
+                self._url_tasks,
                 params={"status": "pending"},
-                timeout=10
-            )
-            
-            if response.status_code == 200:
-                tasks = response.json().get("tasks", [])
-                if tasks:
-                    return tasks[0]  # Return the first pending task
+                timeout=aiohttp.ClientTimeout(total=10)
+            ) as response:
+                if response.status == 200:
+                    tasks = (await response.json(loads=_loads)).get("tasks", [])
+                    if tasks:
+                        return tasks[0]  # Return the first pending task
+                    else:
+                        logger.debug("No pending tasks found")
+                        return None
                 else:
-                    logger.debug("No pending tasks found")
+                    logger.warning(f"Failed to poll for tasks. Status: {response.status}")
                     return None
-            else:
-                logger.warning(f"Failed to poll for tasks. Status: {response.status_code}")
-                return None
-                
+
         except Exception as e:
             logger.error(f"Error polling for tasks: {e}")
             return None
-    
-    def execute_task(self, task):
+
+    async def execute_task(self, task):
         """
         Execute a scanning task
-        
+
         Args:
             task (dict): Task data
-            
+
         Returns:
             dict: Task results
         """
         self.status = "scanning"
-        
+
         # 为向后兼容性处理id/task_id字段
         task_id = task.get("task_id", task.get("id"))
         if not task_id:
@@ -244,12 +326,12 @@ class SastAgent:
             self.status = "idle"
             self.current_task = None
             return {"error": "Task missing required ID field"}
-            
+
         self.current_task = task_id
-        
+
         # Update task status to running
-        self.update_task_status(task_id, "running")
-        
+        await self.update_task_status(task_id, "running")
+
         results = {
             "task_id": task_id,
             "agent_id": self.agent_id,
@@ -258,206 +340,394 @@ class SastAgent:
             "scan_results": {},
             "error": None
         }
-        
+
         repo_path = None
         try:
             # Clone the repository
             repo_url = task.get("repository_url")
             if not repo_url:
                 raise ValueError("Repository URL is required")
-                
+
+            # Run requested scanners
+            scanners = task.get("scanners", self.capabilities)
+            scan_results = {}
+
             branch = task.get("branch")
             depth = task.get("depth", 1)  # Default to shallow clone
-            repo_path = self.repository.clone(repo_url, branch, depth)
-            
+            # A blobless partial clone suffices unless a scanner needs git
+            # history (gitleaks scans commits, not just the working tree)
+            partial = "gitleaks" not in scanners
+            repo_path = await asyncio.to_thread(self.repository.clone, repo_url, branch, depth, partial)
+
             if not repo_path:
                 raise ValueError("Failed to clone repository")
-                
-            # Run requested scanners
-            scanners = task.get("scanners", self.capabilities)
-            scan_results = {}
-            
+
+            # Identify the exact source snapshot so scanners can cache
+            # per-commit artifacts (e.g. CodeQL databases)
+            commit_sha = await asyncio.to_thread(self.repository.head_commit, repo_path)
+
             # Common scanner options
             scan_timeout = task.get("timeout", self.default_timeout)
             logger.info(f"Task timeout set to {scan_timeout} seconds")
-            
-            # Run each requested scanner
+
+            # Collect the runnable scanners, then launch them concurrently:
+            # they are independent processes over the same repo, so wallclock
+            # is the slowest scanner instead of the sum of all of them
+            pending = []
             for scanner_name in scanners:
-                if scanner_name in self.capabilities:
+                if scanner_name not in self.capabilities:
+                    logger.warning(f"Scanner '{scanner_name}' not supported by this agent")
+                    continue
+
+                # Get scanner path if configured
+                scanner_path = self.scanner_paths.get(scanner_name)
+                if scanner_path:
+                    logger.info(f"Using custom path for {scanner_name}: {scanner_path}")
+                scanner = get_scanner(scanner_name, path=scanner_path)
+
+                if scanner:
                     logger.info(f"Running {scanner_name} scanner")
-                    
-                    # Get scanner path if configured
-                    scanner_path = self.scanner_paths.get(scanner_name)
-                    if scanner_path:
-                        logger.info(f"Using custom path for {scanner_name}: {scanner_path}")
-                        
-                        # 对每个扫描器使用正确的参数名称
-                        if scanner_name == 'codeql':
-                            scanner = get_scanner(scanner_name, codeql_path=scanner_path)
-                        elif scanner_name == 'gitleaks':
-                            scanner = get_scanner(scanner_name, gitleaks_path=scanner_path)
-                        else:
-                            # 默认使用扫描器名称作为参数名前缀
-                            scanner = get_scanner(scanner_name, **{f"{scanner_name}_path": scanner_path})
-                    else:
-                        scanner = get_scanner(scanner_name)
-                    
-                    if scanner:
-                        # Get scanner-specific options from task
-                        scanner_options = task.get(f"{scanner_name}_options", {})
-                        
-                        # Run scan with timeout
-                        scan_results[scanner_name] = scanner.scan(
-                            repo_path, 
-                            options=scanner_options,
-                            timeout=scan_timeout
-                        )
-                    else:
-                        logger.warning(f"Scanner '{scanner_name}' not available")
+                    # Get scanner-specific options from task
+                    scanner_options = task.get(f"{scanner_name}_options", {})
+                    if scanner_name == "codeql" and commit_sha:
+                        scanner_options = dict(scanner_options)
+                        scanner_options.setdefault("cache_key", f"{repo_url}@{commit_sha}")
+
+                    # Run scan in a worker thread so heartbeats keep flowing
+                    pending.append((scanner_name, asyncio.to_thread(
+                        scanner.scan,
+                        repo_path,
+                        options=scanner_options,
+                        timeout=scan_timeout
+                    )))
+                else:
+                    logger.warning(f"Scanner '{scanner_name}' not available")
+                    scan_results[scanner_name] = {
+                        "success": False,
+                        "error": f"Scanner '{scanner_name}' not available"
+                    }
+
+            if pending:
+                outcomes = await asyncio.gather(
+                    *(coro for _, coro in pending),
+                    return_exceptions=True
+                )
+                for (scanner_name, _), outcome in zip(pending, outcomes):
+                    if isinstance(outcome, Exception):
+                        logger.error(f"Error running {scanner_name} scanner: {outcome}")
                         scan_results[scanner_name] = {
                             "success": False,
-                            "error": f"Scanner '{scanner_name}' not available"
+                            "error": str(outcome)
                         }
-                else:
-                    logger.warning(f"Scanner '{scanner_name}' not supported by this agent")
-            
+                    else:
+                        scan_results[scanner_name] = outcome
+
             # Update results
             if any(result.get("success", False) for result in scan_results.values()):
                 results["status"] = "completed"
             else:
                 results["status"] = "failed"
                 results["error"] = "All scans failed"
-                
+
             results["end_time"] = datetime.now().isoformat()
             results["scan_results"] = scan_results
-            
+
         except Exception as e:
             logger.error(f"Error executing task: {e}")
             results["status"] = "failed"
             results["error"] = str(e)
             results["end_time"] = datetime.now().isoformat()
-            
+
         finally:
             # Clean up repository
             if repo_path:
                 self.repository.cleanup(repo_path)
-                
+
             # Send results back to console
-            self.send_task_results(results)
-            
+            await self.send_task_results(results)
+
             # Reset agent status
             self.status = "idle"
             self.current_task = None
-            
-            return results
-            
-    def update_task_status(self, task_id, status):
+
+        return results
+
+    async def update_task_status(self, task_id, status):
         """
         Update task status in the console
-        
+
+        The update is queued for the dispatch loop, which batches it with
+        other pending events into a single request.
+
+        Args:
+            task_id (str): Task ID
+            status (str): New status
+
+        Returns:
+            bool: True if update was queued/sent, False otherwise
+        """
+        if self._out_queue is not None:
+            await self._out_queue.put({"kind": "status", "task_id": task_id, "status": status})
+            return True
+        return await self._post_task_status(task_id, status)
+
+    async def send_task_results(self, results):
+        """
+        Send task results back to the console
+
+        The results are queued for the dispatch loop, which batches them with
+        other pending events into a single request.
+
+        Args:
+            results (dict): Task results
+
+        Returns:
+            bool: True if send was queued/sent, False otherwise
+        """
+        if self._out_queue is not None:
+            await self._out_queue.put({"kind": "results", "results": results})
+            return True
+        return await self._post_task_results(results)
+
+    async def _dispatch_loop(self, max_batch=32, max_wait=0.2):
+        """
+        Drain console-bound events, batching them into single requests
+
+        Collects up to max_batch events (waiting at most max_wait seconds
+        for stragglers) and posts them as one batch, so N status updates
+        and results cost one round-trip instead of N.
+        """
+        while True:
+            events = [await self._out_queue.get()]
+            while len(events) < max_batch:
+                try:
+                    events.append(await asyncio.wait_for(self._out_queue.get(), max_wait))
+                except asyncio.TimeoutError:
+                    break
+            await self._send_events(events)
+
+    async def _send_events(self, events):
+        """
+        Send a batch of events to the console
+
+        Uses the batched events endpoint when the console supports it,
+        falling back to per-event requests otherwise.
+
+        Args:
+            events (list): Queued event dicts
+        """
+        if self._batch_events_supported:
+            try:
+                async with self._session.post(
+                    self._url_events,
+                    data=_gzip_json({"events": events}),
+                    headers={
+                        "Content-Type": "application/json",
+                        "Content-Encoding": "gzip"
+                    }
+                ) as response:
+                    if response.status == 200:
+                        logger.debug(f"Sent batch of {len(events)} events")
+                        return
+                    elif response.status == 404:
+                        # Console predates the batched endpoint
+                        self._batch_events_supported = False
+                        logger.info("Console has no batched events endpoint. Using per-event requests.")
+                    else:
+                        logger.warning(f"Failed to send event batch. Status: {response.status}")
+            except Exception as e:
+                logger.error(f"Error sending event batch: {e}")
+
+        for event in events:
+            if event["kind"] == "status":
+                await self._post_task_status(event["task_id"], event["status"])
+            else:
+                await self._post_task_results(event["results"])
+
+    async def _post_task_status(self, task_id, status):
+        """
+        Update task status in the console with a single request
+
         Args:
             task_id (str): Task ID
             status (str): New status
-            
+
         Returns:
             bool: True if update was successful, False otherwise
         """
         try:
-            # 添加时间戳以防止缓存
-            timestamp = int(time.time())
-            response = requests.patch(
-                f"{self.console_url}/api/tasks/{task_id}?t={timestamp}",
-                json={"status": status},
-                headers={
-                    "Cache-Control": "no-cache, no-store, must-revalidate",
-                    "Pragma": "no-cache"
-                },
-                timeout=10
-            )
-            
-            if response.status_code == 200:
-                logger.info(f"Task {task_id} status updated to {status}")
-                return True
-            else:
-                logger.warning(f"Failed to update task status. Status: {response.status_code}")
-                return False
-                
+            async with self._session.patch(
+                f"{self.console_url}/api/tasks/{task_id}",
+                data=_dumps({"status": status}),
+                headers={"Content-Type": "application/json"},
+                timeout=aiohttp.ClientTimeout(total=10)
+            ) as response:
+                if response.status == 200:
+                    logger.info(f"Task {task_id} status updated to {status}")
+                    return True
+                else:
+                    logger.warning(f"Failed to update task status. Status: {response.status}")
+                    return False
+
         except Exception as e:
             logger.error(f"Error updating task status: {e}")
             return False
-            
-    def send_task_results(self, results):
+
+    async def _post_task_results(self, results):
         """
-        Send task results back to the console
-        
+        Send task results to the console with a single request
+
         Args:
             results (dict): Task results
-            
+
         Returns:
             bool: True if send was successful, False otherwise
         """
         try:
-            # 添加时间戳以防止缓存
-            timestamp = int(time.time())
-            response = requests.post(
-                f"{self.console_url}/api/tasks/{results['task_id']}/results?t={timestamp}",
-                json=results,
+            async with self._session.post(
+                f"{self.console_url}/api/tasks/{results['task_id']}/results",
+                data=_gzip_json(results),
                 headers={
-                    "Cache-Control": "no-cache, no-store, must-revalidate",
-                    "Pragma": "no-cache"
-                },
-                timeout=30
-            )
-            
-            if response.status_code == 200:
-                logger.info(f"Task results sent successfully")
-                return True
-            else:
-                logger.warning(f"Failed to send task results. Status: {response.status_code}")
-                return False
-                
+                    "Content-Type": "application/json",
+                    "Content-Encoding": "gzip"
+                }
+            ) as response:
+                if response.status == 200:
+                    logger.info(f"Task results sent successfully")
+                    return True
+                else:
+                    logger.warning(f"Failed to send task results. Status: {response.status}")
+                    return False
+
         except Exception as e:
             logger.error(f"Error sending task results: {e}")
             return False
-            
-    def run(self):
+
+    async def _ws_status_loop(self, ws, interval):
+        """Send status frames over an open WebSocket at a fixed cadence"""
+        while True:
+            await ws.send_json({
+                "agent_id": self.agent_id,
+                "status": self.status,
+                "current_task": self.current_task,
+                "timestamp": datetime.now().isoformat()
+            })
+            await asyncio.sleep(interval)
+
+    async def _ws_loop(self, heartbeat_interval=30):
+        """
+        Maintain a persistent WebSocket to the console
+
+        The agent sends lightweight status frames instead of per-heartbeat
+        HTTP POSTs, and the console pushes tasks down the same connection
+        instead of being polled. Raises on connection failure so run() can
+        fall back to the HTTP heartbeat/poll loops.
+        """
+        async with self._session.ws_connect(self._url_ws, heartbeat=heartbeat_interval) as ws:
+            logger.info("WebSocket connection to console established")
+            status_sender = asyncio.ensure_future(self._ws_status_loop(ws, heartbeat_interval))
+            try:
+                async for msg in ws:
+                    if msg.type == aiohttp.WSMsgType.TEXT:
+                        try:
+                            data = msg.json()
+                        except ValueError:
+                            logger.warning(f"Ignoring malformed WebSocket message: {msg.data!r}")
+                            continue
+
+                        if data.get("type") == "task":
+                            task = data.get("task", data)
+                            # 确保task_id字段存在
+                            if 'id' in task and 'task_id' not in task:
+                                task['task_id'] = task['id']
+
+                            logger.info(f"Received task {task.get('task_id', task.get('id', 'unknown'))}")
+                            await self.execute_task(task)
+                    elif msg.type == aiohttp.WSMsgType.ERROR:
+                        break
+            finally:
+                status_sender.cancel()
+
+    async def _heartbeat_loop(self, interval=30):
+        """Send heartbeats at a fixed cadence"""
+        while True:
+            await self.heartbeat()
+            await asyncio.sleep(interval)
+
+    async def _poll_loop(self, min_interval=1.0, max_interval=30.0):
+        """
+        Poll for tasks when idle
+
+        Uses exponential backoff between empty polls (min_interval up to
+        max_interval) so idle agents back off while busy agents pick up
+        new tasks within ~min_interval seconds.
+        """
+        backoff = min_interval
+        while True:
+            task = None
+            if self.status == "idle":
+                task = await self.poll_for_tasks()
+
+            if task:
+                # 确保task_id字段存在
+                if 'id' in task and 'task_id' not in task:
+                    task['task_id'] = task['id']
+
+                logger.info(f"Received task {task.get('task_id', task.get('id', 'unknown'))}")
+                await self.execute_task(task)
+                backoff = min_interval
+            else:
+                backoff = min(backoff * 2, max_interval)
+
+            # Sleep to avoid hammering the server
+            await asyncio.sleep(backoff)
+
+    async def run(self):
         """Main agent loop"""
         logger.info(f"Starting SAST agent {self.agent_name}")
-        
-        if not self.registered:
-            if not self.register():
-                logger.error("Failed to register agent. Exiting.")
-                return
-                
-        logger.info(f"Agent registered with ID {self.agent_id}")
-        logger.info(f"Agent capabilities: {', '.join(self.capabilities)}")
-        
+
         try:
-            heartbeat_interval = 30  # seconds
-            last_heartbeat = 0
-            
-            while True:
-                # Send heartbeat at regular intervals
-                current_time = time.time()
-                if current_time - last_heartbeat >= heartbeat_interval:
-                    self.heartbeat()
-                    last_heartbeat = current_time
-                
-                # Poll for tasks when idle
-                if self.status == "idle":
-                    task = self.poll_for_tasks()
-                    if task:
-                        # 确保task_id字段存在
-                        if 'id' in task and 'task_id' not in task:
-                            task['task_id'] = task['id']
-                            
-                        logger.info(f"Received task {task.get('task_id', task.get('id', 'unknown'))}")
-                        self.execute_task(task)
-                
-                # Sleep to avoid hammering the server
-                time.sleep(5)
-                
-        except KeyboardInterrupt:
+            async with aiohttp.ClientSession(
+                headers={
+                    "Cache-Control": "no-cache, no-store, must-revalidate",
+                    "Pragma": "no-cache"
+                },
+                timeout=aiohttp.ClientTimeout(total=30),
+                # Keep a small pool of warm keep-alive connections to the
+                # console so steady-state traffic skips TCP+TLS setup
+                connector=aiohttp.TCPConnector(limit=8, keepalive_timeout=60)
+            ) as self._session:
+                if not self.registered:
+                    if not await self.register():
+                        logger.error("Failed to register agent. Exiting.")
+                        return
+
+                logger.info(f"Agent registered with ID {self.agent_id}")
+                logger.info(f"Agent capabilities: {', '.join(self.capabilities)}")
+
+                # All console-bound writes funnel through one batching dispatcher
+                self._out_queue = asyncio.Queue()
+                dispatcher = asyncio.ensure_future(self._dispatch_loop())
+
+                try:
+                    # Prefer a persistent WebSocket: one connection carries both
+                    # status frames and console-pushed tasks
+                    try:
+                        await self._ws_loop()
+                        logger.warning("WebSocket connection closed by console")
+                    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                        logger.warning(f"WebSocket unavailable ({e}). Falling back to HTTP heartbeat/polling.")
+
+                    # Heartbeat and task polling run as independent coroutines so a
+                    # slow round-trip on one never delays the other
+                    await asyncio.gather(self._heartbeat_loop(), self._poll_loop())
+                finally:
+                    # Flush anything still queued before tearing down the session
+                    while not self._out_queue.empty():
+                        await self._send_events([self._out_queue.get_nowait()])
+                    dispatcher.cancel()
+
+        except asyncio.CancelledError:
             logger.info("Agent interrupted. Shutting down.")
         except Exception as e:
             logger.error(f"Unexpected error: {e}")
@@ -465,10 +735,10 @@ class SastAgent:
         finally:
             # Clean up any resources
             self.repository.cleanup()
-            
+
 def main():
     import argparse
-    
+
     parser = argparse.ArgumentParser(description="SAST Agent")
     parser.add_argument("--console", default="https://sast-console.vercel.app", help="Console URL")
     parser.add_argument("--name", help="Agent name")
@@ -477,21 +747,24 @@ def main():
     parser.add_argument("--codeql-path", help="Path to CodeQL executable")
     parser.add_argument("--gitleaks-path", help="Path to GitLeaks executable")
     args = parser.parse_args()
-    
+
     # Set log level
     log_level = getattr(logging, args.log_level)
     setup_logging(log_level=log_level)
-    
+
     # Prepare scanner paths
     scanner_paths = {}
     if args.codeql_path:
         scanner_paths['codeql'] = args.codeql_path
     if args.gitleaks_path:
         scanner_paths['gitleaks'] = args.gitleaks_path
-    
+
     # Create and run agent
     agent = SastAgent(args.console, args.name, args.timeout, scanner_paths)
-    agent.run()
+    try:
+        asyncio.run(agent.run())
+    except KeyboardInterrupt:
+        logger.info("Agent interrupted. Shutting down.")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
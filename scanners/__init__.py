@@ -3,32 +3,36 @@ from .base import BaseScanner
 from .gitleaks import GitLeaksScanner
 from .codeql import CodeQLScanner
 
-# Dictionary of available scanners
+# Dictionary of available scanners: name -> (class, executable-path kwarg)
 AVAILABLE_SCANNERS = {
-    "gitleaks": GitLeaksScanner,
-    "codeql": CodeQLScanner
+    "gitleaks": (GitLeaksScanner, "gitleaks_path"),
+    "codeql": (CodeQLScanner, "codeql_path")
 }
 
-def get_scanner(scanner_name, **kwargs):
+def get_scanner(scanner_name, path=None, **kwargs):
     """
     Factory function to get a scanner instance
-    
+
     Args:
         scanner_name (str): Name of the scanner
+        path (str): Optional path to the scanner executable
         **kwargs: Additional arguments to pass to the scanner constructor
-        
+
     Returns:
         BaseScanner: Instance of the requested scanner or None if not found
     """
-    scanner_class = AVAILABLE_SCANNERS.get(scanner_name.lower())
-    if scanner_class:
+    entry = AVAILABLE_SCANNERS.get(scanner_name.lower())
+    if entry:
+        scanner_class, path_kwarg = entry
+        if path:
+            kwargs.setdefault(path_kwarg, path)
         return scanner_class(**kwargs)
     return None
 
 def list_available_scanners():
     """
     Get a list of available scanners
-    
+
     Returns:
         list: List of available scanner names
     """
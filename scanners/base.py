@@ -1,10 +1,15 @@
 #!/usr/bin/env python3
+import asyncio
 import logging
 import subprocess
+import tempfile
 import time
 import json
 from abc import ABC, abstractmethod
 
+# Keep at most this much captured output per stream
+_OUTPUT_CAP = 10 * 1024 * 1024
+
 class BaseScanner(ABC):
     """Base class for all security scanners"""
     
@@ -35,56 +40,154 @@ class BaseScanner(ABC):
         """
         pass
         
-    def run_process(self, command, timeout=None):
+    def run_process(self, command, timeout=None, output_cap=_OUTPUT_CAP):
         """
         Run a subprocess with timeout
-        
+
         Args:
             command (list): Command to run
             timeout (int): Timeout in seconds (uses default if None)
-            
+            output_cap (int): Maximum bytes of output kept per stream;
+                None for unlimited (e.g. when stdout carries a report)
+
         Returns:
             dict: Process results
         """
         if timeout is None:
             timeout = self.default_timeout
-            
+
         self.logger.info(f"Running command: {' '.join(command)}")
         start_time = time.time()
-        
+
         try:
-            process = subprocess.run(
-                command,
-                capture_output=True,
-                text=True,
-                timeout=timeout
-            )
-            
+            # The child writes straight to unnamed temp files (CodeQL can
+            # emit 100MB+ of progress to stderr) instead of the parent
+            # buffering everything through pipes in Python memory
+            with tempfile.TemporaryFile() as stdout_file, \
+                 tempfile.TemporaryFile() as stderr_file:
+                process = subprocess.Popen(
+                    command,
+                    stdout=stdout_file,
+                    stderr=stderr_file
+                )
+
+                try:
+                    process.wait(timeout=timeout)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    process.wait()
+                    raise
+
+                execution_time = time.time() - start_time
+                self.logger.info(f"Command completed in {execution_time:.2f} seconds with exit code {process.returncode}")
+
+                return {
+                    "success": process.returncode == 0,
+                    "exit_code": process.returncode,
+                    "stdout": self._read_captured(stdout_file, output_cap),
+                    "stderr": self._read_captured(stderr_file, output_cap),
+                    "execution_time": execution_time
+                }
+
+        except subprocess.TimeoutExpired:
             execution_time = time.time() - start_time
-            self.logger.info(f"Command completed in {execution_time:.2f} seconds with exit code {process.returncode}")
-            
+            self.logger.error(f"Command timed out after {execution_time:.2f} seconds")
+
             return {
-                "success": process.returncode == 0,
-                "exit_code": process.returncode,
-                "stdout": process.stdout,
-                "stderr": process.stderr,
+                "success": False,
+                "error": f"Command timed out after {timeout} seconds",
                 "execution_time": execution_time
             }
             
-        except subprocess.TimeoutExpired:
+        except Exception as e:
             execution_time = time.time() - start_time
-            self.logger.error(f"Command timed out after {execution_time:.2f} seconds")
-            
+            self.logger.error(f"Error running command: {e}")
+
             return {
                 "success": False,
-                "error": f"Command timed out after {timeout} seconds",
+                "error": str(e),
                 "execution_time": execution_time
             }
-            
+
+    @staticmethod
+    def _read_captured(output_file, cap=_OUTPUT_CAP):
+        """
+        Read captured child output from a temp file
+
+        Output beyond the cap is truncated from the front, keeping the tail
+        (where errors usually are), so a chatty child cannot balloon the
+        result dict.
+
+        Args:
+            output_file: Temp file the child wrote to
+            cap (int): Maximum bytes to keep, or None for unlimited
+
+        Returns:
+            str: Decoded (possibly truncated) output
+        """
+        size = output_file.seek(0, 2)
+        if cap is not None and size > cap:
+            output_file.seek(size - cap)
+            return "[... output truncated ...]\n" + output_file.read().decode(errors="replace")
+        output_file.seek(0)
+        return output_file.read().decode(errors="replace")
+
+    async def run_process_async(self, command, timeout=None):
+        """
+        Run a subprocess asynchronously with timeout
+
+        Like run_process, but awaitable so multiple scanner pipelines can
+        run concurrently on one event loop.
+
+        Args:
+            command (list): Command to run
+            timeout (int): Timeout in seconds (uses default if None)
+
+        Returns:
+            dict: Process results
+        """
+        if timeout is None:
+            timeout = self.default_timeout
+
+        self.logger.info(f"Running command: {' '.join(command)}")
+        start_time = time.time()
+
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+
+            try:
+                stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.communicate()
+                execution_time = time.time() - start_time
+                self.logger.error(f"Command timed out after {execution_time:.2f} seconds")
+
+                return {
+                    "success": False,
+                    "error": f"Command timed out after {timeout} seconds",
+                    "execution_time": execution_time
+                }
+
+            execution_time = time.time() - start_time
+            self.logger.info(f"Command completed in {execution_time:.2f} seconds with exit code {process.returncode}")
+
+            return {
+                "success": process.returncode == 0,
+                "exit_code": process.returncode,
+                "stdout": stdout.decode(errors="replace"),
+                "stderr": stderr.decode(errors="replace"),
+                "execution_time": execution_time
+            }
+
         except Exception as e:
             execution_time = time.time() - start_time
             self.logger.error(f"Error running command: {e}")
-            
+
             return {
                 "success": False,
                 "error": str(e),
@@ -1,104 +1,240 @@
 #!/usr/bin/env python3
 import os
 import json
+import asyncio
+import hashlib
 import tempfile
 import uuid
 import shutil
+from collections import Counter
 from .base import BaseScanner
 
+# ijson lets us stream SARIF output run-by-run instead of materializing
+# the whole document (often hundreds of MB) at once
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Simple language detection based on file extensions
+EXTENSION_MAP = {
+    '.py': 'python',
+    '.js': 'javascript',
+    '.ts': 'javascript',  # TypeScript uses JavaScript analysis in CodeQL
+    '.java': 'java',
+    '.c': 'cpp',
+    '.cpp': 'cpp',
+    '.h': 'cpp',
+    '.hpp': 'cpp',
+    '.cs': 'csharp',
+    '.go': 'go',
+    '.rb': 'ruby'
+}
+_KNOWN_EXTENSIONS = frozenset(EXTENSION_MAP)
+
+# Vendored/generated trees that would skew detection and waste walk time
+_SKIP_DIRS = frozenset({'.git', 'node_modules', 'vendor', 'venv', '.venv', '__pycache__'})
+
+# Stop the detection walk early once the leading language is far enough
+# ahead that the remaining files cannot change the outcome meaningfully
+_EARLY_EXIT_CHECK_EVERY = 5000
+_EARLY_EXIT_MARGIN = 1000
+
+# Cap on the persistent CodeQL database cache; least-recently-used
+# databases are evicted once the cache grows past this
+_DB_CACHE_MAX_BYTES = 20 * 1024 * 1024 * 1024
+
 class CodeQLScanner(BaseScanner):
     """CodeQL scanner implementation"""
-    
-    def __init__(self, default_timeout=1800, codeql_path=None):  # Default timeout 30 minutes
+
+    def __init__(self, default_timeout=1800, codeql_path=None, db_cache_dir=None):  # Default timeout 30 minutes
         """
         Initialize CodeQL scanner
-        
+
         Args:
             default_timeout (int): Default timeout in seconds
             codeql_path (str): Optional path to codeql executable
+            db_cache_dir (str): Directory for the persistent database cache
+                (default: ~/.cache/sast-agent/codeql-db)
         """
         super().__init__("codeql", default_timeout)
         self.codeql_path = codeql_path or "codeql"  # Use provided path or fallback to command name
+        self.db_cache_dir = db_cache_dir or os.path.join(
+            os.path.expanduser("~"), ".cache", "sast-agent", "codeql-db"
+        )
         self.logger.info(f"Using CodeQL executable: {self.codeql_path}")
-        
+
     def scan(self, target_dir, options=None, timeout=None):
         """
         Run CodeQL scan on target directory
-        
+
+        Synchronous facade around scan_async for callers without an
+        event loop of their own.
+
         Args:
             target_dir (str): Target directory to scan
             options (dict): Additional options for CodeQL
             timeout (int): Timeout in seconds
-            
+
         Returns:
             dict: Scan results
         """
+        return asyncio.run(self.scan_async(target_dir, options, timeout))
+
+    async def scan_async(self, target_dir, options=None, timeout=None):
+        """
+        Run CodeQL scans for all detected languages concurrently
+
+        Each language gets its own database create + analyze pipeline;
+        pipelines run in parallel so wallclock is bounded by the slowest
+        language rather than the sum of all of them.
+
+        Args:
+            target_dir (str): Target directory to scan
+            options (dict): Additional options for CodeQL
+            timeout (int): Timeout in seconds (applies per pipeline step)
+
+        Returns:
+            dict: Merged scan results across languages
+        """
         if options is None:
             options = {}
-            
-        # Create temporary directory for CodeQL database and results
-        temp_db_dir = tempfile.mkdtemp(prefix="codeql_db_")
+
+        # Determine languages if not specified
+        language = options.get("language")
+        if language:
+            languages = [language]
+        else:
+            languages = self._detect_languages(target_dir)
+            if not languages:
+                return {
+                    "success": False,
+                    "error": "Failed to detect language for CodeQL analysis"
+                }
+
+        self.logger.info(f"Running CodeQL analysis for languages: {', '.join(languages)}")
+        lang_results = await asyncio.gather(
+            *[self._scan_language(target_dir, lang, options, timeout) for lang in languages]
+        )
+
+        # Merge per-language results into a single SARIF-shaped payload
+        merged = {
+            "success": False,
+            "languages": languages,
+            "findings": {"runs": []},
+            "execution_time": 0,
+            "errors": {}
+        }
+
+        for lang, result in zip(languages, lang_results):
+            merged["execution_time"] += result.get("execution_time") or 0
+            if result.get("success"):
+                merged["success"] = True
+                sarif = result.get("findings", {})
+                for key in ("version", "$schema"):
+                    if key in sarif and key not in merged["findings"]:
+                        merged["findings"][key] = sarif[key]
+                merged["findings"]["runs"].extend(sarif.get("runs", []))
+            else:
+                merged["errors"][lang] = result.get("error", "CodeQL analysis failed")
+
+        if not merged["success"]:
+            merged["error"] = "CodeQL analysis failed for all languages"
+
+        return merged
+
+    async def _scan_language(self, target_dir, language, options, timeout):
+        """
+        Run the create+analyze pipeline for a single language
+
+        Args:
+            target_dir (str): Target directory to scan
+            language (str): CodeQL language to analyze
+            options (dict): Additional options for CodeQL
+            timeout (int): Timeout in seconds
+
+        Returns:
+            dict: Scan results for this language
+        """
+        # Reuse a cached database when the caller identifies the exact
+        # source snapshot (repo@sha); DB creation usually dominates scan time
+        cache_key = options.get("cache_key")
+        if cache_key:
+            digest = hashlib.sha256(f"{cache_key}:{language}".encode()).hexdigest()
+            temp_db_dir = os.path.join(self.db_cache_dir, digest)
+            db_cached = os.path.exists(os.path.join(temp_db_dir, "codeql-database.yml"))
+            if not db_cached and os.path.isdir(temp_db_dir):
+                # Leftover from a failed create; never reuse a partial DB
+                shutil.rmtree(temp_db_dir, ignore_errors=True)
+        else:
+            # Create temporary directory for CodeQL database
+            temp_db_dir = tempfile.mkdtemp(prefix="codeql_db_")
+            db_cached = False
+
         output_file = os.path.join(tempfile.gettempdir(), f"codeql_results_{uuid.uuid4()}.sarif")
-        
+        create_result = {"execution_time": 0}
+
         try:
-            # Determine language if not specified
-            language = options.get("language")
-            if not language:
-                language = self._detect_language(target_dir)
-                if not language:
+            if db_cached:
+                self.logger.info(f"Reusing cached CodeQL database for {language} ({cache_key})")
+                os.utime(temp_db_dir)  # Refresh for LRU eviction
+            else:
+                # Step 1: Create CodeQL database
+                self.logger.info(f"Creating CodeQL database for {language}")
+                create_cmd = [
+                    self.codeql_path, "database", "create",
+                    "--language", language,
+                    "--source-root", target_dir,
+                    temp_db_dir
+                ]
+
+                # Add additional database creation options
+                if options.get("threads"):
+                    create_cmd.extend(["--threads", str(options["threads"])])
+
+                if cache_key:
+                    os.makedirs(self.db_cache_dir, exist_ok=True)
+
+                create_result = await self.run_process_async(create_cmd, timeout)
+                if not create_result["success"]:
+                    if cache_key:
+                        shutil.rmtree(temp_db_dir, ignore_errors=True)
                     return {
                         "success": False,
-                        "error": "Failed to detect language for CodeQL analysis"
+                        "error": "Failed to create CodeQL database",
+                        "stdout": create_result.get("stdout", ""),
+                        "stderr": create_result.get("stderr", ""),
+                        "execution_time": create_result.get("execution_time")
                     }
-            
-            # Step 1: Create CodeQL database
-            self.logger.info(f"Creating CodeQL database for {language}")
-            create_cmd = [
-                self.codeql_path, "database", "create", 
-                "--language", language,
-                "--source-root", target_dir,
-                temp_db_dir
-            ]
-            
-            # Add additional database creation options
-            if options.get("threads"):
-                create_cmd.extend(["--threads", str(options["threads"])])
-            
-            create_result = self.run_process(create_cmd, timeout)
-            if not create_result["success"]:
-                return {
-                    "success": False,
-                    "error": "Failed to create CodeQL database",
-                    "stdout": create_result.get("stdout", ""),
-                    "stderr": create_result.get("stderr", ""),
-                    "execution_time": create_result.get("execution_time")
-                }
-            
+
+                if cache_key:
+                    self._evict_db_cache()
+
             # Step 2: Analyze the database
-            self.logger.info("Analyzing CodeQL database")
+            self.logger.info(f"Analyzing CodeQL database for {language}")
             query_suite = options.get("query_suite", f"{language}-security-and-quality")
-            
+
             analyze_cmd = [
                 self.codeql_path, "database", "analyze",
                 "--format", "sarif-latest",
                 "--output", output_file,
                 temp_db_dir, query_suite
             ]
-            
-            analyze_result = self.run_process(analyze_cmd, timeout)
-            
+
+            analyze_result = await self.run_process_async(analyze_cmd, timeout)
+
             # Process results
             if analyze_result["success"] and os.path.exists(output_file):
                 try:
-                    with open(output_file, 'r') as f:
-                        # Parse SARIF results
-                        sarif_results = json.load(f)
-                        
+                    # Parse SARIF results
+                    sarif_results = self._load_sarif(output_file)
+                    self._dedup_finding_strings(sarif_results)
+
                     total_execution_time = (
-                        create_result.get("execution_time", 0) + 
+                        create_result.get("execution_time", 0) +
                         analyze_result.get("execution_time", 0)
                     )
-                    
+
                     return {
                         "success": True,
                         "exit_code": analyze_result.get("exit_code", 0),
@@ -112,7 +248,7 @@ class CodeQLScanner(BaseScanner):
                         "success": False,
                         "error": f"Error parsing results: {str(e)}",
                         "execution_time": (
-                            create_result.get("execution_time", 0) + 
+                            create_result.get("execution_time", 0) +
                             analyze_result.get("execution_time", 0)
                         )
                     }
@@ -123,53 +259,175 @@ class CodeQLScanner(BaseScanner):
                     "stdout": analyze_result.get("stdout", ""),
                     "stderr": analyze_result.get("stderr", ""),
                     "execution_time": (
-                        create_result.get("execution_time", 0) + 
+                        create_result.get("execution_time", 0) +
                         analyze_result.get("execution_time", 0)
                     )
                 }
         finally:
-            # Clean up
-            if os.path.exists(temp_db_dir):
+            # Clean up; cached databases are kept for reuse and evicted by size
+            if not cache_key and os.path.exists(temp_db_dir):
                 shutil.rmtree(temp_db_dir, ignore_errors=True)
             if os.path.exists(output_file):
                 os.remove(output_file)
-    
-    def _detect_language(self, target_dir):
+
+    def _evict_db_cache(self, max_bytes=_DB_CACHE_MAX_BYTES):
+        """
+        Evict least-recently-used cached databases over the size cap
+
+        Args:
+            max_bytes (int): Maximum total cache size in bytes
+        """
+        try:
+            entries = []
+            with os.scandir(self.db_cache_dir) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        size = sum(
+                            os.path.getsize(os.path.join(root, f))
+                            for root, _, files in os.walk(entry.path)
+                            for f in files
+                        )
+                        entries.append((entry.stat().st_mtime, entry.path, size))
+
+            total = sum(size for _, _, size in entries)
+            entries.sort()  # Oldest mtime first
+            for _, path, size in entries:
+                if total <= max_bytes:
+                    break
+                self.logger.info(f"Evicting cached CodeQL database {path}")
+                shutil.rmtree(path, ignore_errors=True)
+                total -= size
+        except OSError as e:
+            self.logger.warning(f"Error pruning CodeQL database cache: {e}")
+
+    @staticmethod
+    def _dedup_finding_strings(sarif):
+        """
+        Collapse duplicate strings across parsed SARIF findings
+
+        CodeQL repeats the same ruleId, message text and file URI across
+        thousands of results; after parsing each repeat is a distinct str
+        object. Pointing them all at one shared object per distinct value
+        substantially shrinks the in-memory findings before they are queued
+        for upload. Serialized output is unchanged.
+
+        Args:
+            sarif (dict): Parsed SARIF document (modified in place)
+        """
+        shared = {}
+        dedup = shared.setdefault
+        for run in sarif.get("runs", []):
+            for result in run.get("results", []):
+                rule_id = result.get("ruleId")
+                if isinstance(rule_id, str):
+                    result["ruleId"] = dedup(rule_id, rule_id)
+
+                message = result.get("message")
+                if isinstance(message, dict):
+                    text = message.get("text")
+                    if isinstance(text, str):
+                        message["text"] = dedup(text, text)
+
+                for location in result.get("locations", []):
+                    artifact = location.get("physicalLocation", {}).get("artifactLocation")
+                    if artifact:
+                        uri = artifact.get("uri")
+                        if isinstance(uri, str):
+                            artifact["uri"] = dedup(uri, uri)
+
+    def _load_sarif(self, path):
+        """
+        Load a SARIF results file
+
+        Streams runs one at a time with ijson when it is installed, so peak
+        memory is bounded by the largest run instead of the whole document
+        plus parser overhead. The file is read in a single sequential pass
+        (top-level scalars and runs together), so the source could equally
+        be a pipe. Falls back to json.load otherwise.
+
+        Args:
+            path (str): Path to the SARIF file
+
+        Returns:
+            dict: Parsed SARIF document
+        """
+        if ijson is None:
+            with open(path, 'r') as f:
+                return json.load(f)
+
+        sarif = {"runs": []}
+        builder = None
+
+        with open(path, 'rb') as f:
+            for prefix, event, value in ijson.parse(f):
+                if builder is not None:
+                    builder.event(event, value)
+                    if prefix == 'runs.item' and event == 'end_map':
+                        sarif["runs"].append(builder.value)
+                        builder = None
+                elif prefix == 'runs.item' and event == 'start_map':
+                    builder = ijson.ObjectBuilder()
+                    builder.event(event, value)
+                elif prefix in ('version', '$schema'):
+                    sarif[prefix] = value
+
+        return sarif
+
+    def _detect_languages(self, target_dir, min_files=5):
         """
-        Attempt to detect the primary language for CodeQL analysis
-        
+        Detect the languages present in a repository for CodeQL analysis
+
         Args:
             target_dir (str): Target directory to analyze
-            
+            min_files (int): Minimum file count for a language to be analyzed
+
         Returns:
-            str: Detected language or None if detection fails
-        """
-        # Simple language detection based on file extensions
-        extension_map = {
-            '.py': 'python',
-            '.js': 'javascript',
-            '.ts': 'javascript',  # TypeScript uses JavaScript analysis in CodeQL
-            '.java': 'java',
-            '.c': 'cpp',
-            '.cpp': 'cpp',
-            '.h': 'cpp',
-            '.hpp': 'cpp',
-            '.cs': 'csharp',
-            '.go': 'go',
-            '.rb': 'ruby'
-        }
-        
-        # Count files by language
-        lang_count = {}
-        
-        for root, _, files in os.walk(target_dir):
-            for file in files:
-                _, ext = os.path.splitext(file)
-                if ext in extension_map:
-                    lang = extension_map[ext]
-                    lang_count[lang] = lang_count.get(lang, 0) + 1
-        
-        # Return the most common language or None if no supported languages found
-        if lang_count:
-            return max(lang_count.items(), key=lambda x: x[1])[0]
-        return None
+            list: Detected languages sorted by file count (most common first),
+                  empty if no supported languages were found
+        """
+        # Count files by language with scandir, which avoids the extra
+        # stat per entry that os.walk pays, skipping vendored trees
+        lang_count = Counter()
+        pending = [target_dir]
+        files_seen = 0
+        next_check = _EARLY_EXIT_CHECK_EVERY
+
+        while pending:
+            directory = pending.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in _SKIP_DIRS:
+                                pending.append(entry.path)
+                        else:
+                            files_seen += 1
+                            dot = entry.name.rfind('.')
+                            if dot >= 0:
+                                ext = entry.name[dot:]
+                                if ext in _KNOWN_EXTENSIONS:
+                                    lang_count[EXTENSION_MAP[ext]] += 1
+            except OSError as e:
+                self.logger.debug(f"Skipping unreadable directory {directory}: {e}")
+
+            # Periodically check whether the ranking is already settled so
+            # huge repos don't have to be walked to the end
+            if files_seen >= next_check:
+                next_check = files_seen + _EARLY_EXIT_CHECK_EVERY
+                ranked = lang_count.most_common(2)
+                if len(ranked) >= 1:
+                    top_count = ranked[0][1]
+                    second_count = ranked[1][1] if len(ranked) > 1 else 0
+                    if top_count > 2 * second_count + _EARLY_EXIT_MARGIN:
+                        self.logger.debug(
+                            f"Language ranking settled after {files_seen} files; stopping walk early"
+                        )
+                        break
+
+        # Keep every language above the threshold, most common first; if
+        # nothing clears the bar, fall back to the single most common one
+        ranked = sorted(lang_count.items(), key=lambda x: x[1], reverse=True)
+        languages = [lang for lang, count in ranked if count >= min_files]
+        if not languages and ranked:
+            languages = [ranked[0][0]]
+        return languages
@@ -1,59 +1,201 @@
 #!/usr/bin/env python3
 import os
 import json
+import time
+import asyncio
 import tempfile
-import uuid
+import itertools
 from .base import BaseScanner
 
+# orjson parses large reports several times faster than stdlib json;
+# fall back to stdlib when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ijson streams the findings array without holding the raw bytes and the
+# parsed document in memory at the same time
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Prefer RAM-backed tmpfs for the report file when available: the report
+# is written once and read straight back, so there is no reason to round-
+# trip it through disk
+_TMP = '/dev/shm' if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK) else tempfile.gettempdir()
+
+# Temp-file name token: pid + start time disambiguate processes, the
+# counter disambiguates scans within one process. Unlike uuid4 this never
+# touches the kernel entropy pool, which matters when scans are batched.
+_TMP_BASE = f"{os.getpid()}_{int(time.time() * 1000):x}"
+_TMP_COUNTER = itertools.count()
+
 class GitLeaksScanner(BaseScanner):
     """GitLeaks scanner implementation"""
     
-    def __init__(self, default_timeout=300):
-        """Initialize GitLeaks scanner"""
+    def __init__(self, default_timeout=300, gitleaks_path=None):
+        """
+        Initialize GitLeaks scanner
+
+        Args:
+            default_timeout (int): Default timeout in seconds
+            gitleaks_path (str): Optional path to gitleaks executable
+        """
         super().__init__("gitleaks", default_timeout)
+        self.gitleaks_path = gitleaks_path or "gitleaks"  # Use provided path or fallback to command name
         
-    def scan(self, target_dir, options=None, timeout=None):
+    def _build_command(self, target_dir, options):
         """
-        Run GitLeaks scan on target directory
-        
+        Build the gitleaks command line for a scan
+
+        Streams the report over stdout on POSIX, avoiding the temp-file
+        write/read/unlink round-trip entirely; falls back to a temp file
+        (tmpfs-backed where possible) elsewhere.
+
         Args:
             target_dir (str): Target directory to scan
             options (dict): Additional options for GitLeaks
-            timeout (int): Timeout in seconds
-            
+
         Returns:
-            dict: Scan results
+            tuple: (command list, use_stdout flag, output file path or None)
         """
-        if options is None:
-            options = {}
-            
-        # Create temporary file for results
-        output_file = os.path.join(tempfile.gettempdir(), f"gitleaks_results_{uuid.uuid4()}.json")
-        
+        use_stdout = os.path.exists('/dev/stdout')
+        if use_stdout:
+            output_file = None
+            report_path = '/dev/stdout'
+        else:
+            # Create temporary file for results
+            output_file = os.path.join(_TMP, f"gitleaks_results_{_TMP_BASE}_{next(_TMP_COUNTER)}.json")
+            report_path = output_file
+
         # Build command
-        command = ["gitleaks", "detect", "--source", target_dir, "--report-path", output_file, "--report-format", "json"]
-        
+        command = [self.gitleaks_path, "detect", "--source", target_dir, "--report-path", report_path, "--report-format", "json", "--no-banner"]
+
         # Add additional options
         if options.get("config_path"):
             command.extend(["--config-path", options["config_path"]])
-        
+
         if options.get("redact"):
             command.append("--redact")
-            
-        # Run scan
-        process_result = self.run_process(command, timeout)
-        
-        # Process results
+
+        return command, use_stdout, output_file
+
+    def scan(self, target_dir, options=None, timeout=None):
+        """
+        Run GitLeaks scan on target directory
+
+        Args:
+            target_dir (str): Target directory to scan
+            options (dict): Additional options for GitLeaks
+            timeout (int): Timeout in seconds
+
+        Returns:
+            dict: Scan results
+        """
+        if options is None:
+            options = {}
+
+        command, use_stdout, output_file = self._build_command(target_dir, options)
+
+        # Run scan; when the report arrives on stdout it must not be capped
+        if use_stdout:
+            process_result = self.run_process(command, timeout, output_cap=None)
+        else:
+            process_result = self.run_process(command, timeout)
+
+        return self._process_results(process_result, use_stdout, output_file)
+
+    async def scan_async(self, target_dir, options=None, timeout=None):
+        """
+        Run GitLeaks scan asynchronously
+
+        Awaitable counterpart of scan, so independent checkouts can be
+        scanned concurrently on one event loop (see scan_many).
+
+        Args:
+            target_dir (str): Target directory to scan
+            options (dict): Additional options for GitLeaks
+            timeout (int): Timeout in seconds
+
+        Returns:
+            dict: Scan results
+        """
+        if options is None:
+            options = {}
+
+        command, use_stdout, output_file = self._build_command(target_dir, options)
+        process_result = await self.run_process_async(command, timeout)
+        return self._process_results(process_result, use_stdout, output_file)
+
+    async def scan_many(self, target_dirs, options=None, timeout=None):
+        """
+        Scan multiple target directories concurrently
+
+        Args:
+            target_dirs (list): Target directories to scan
+            options (dict): Additional options for GitLeaks
+            timeout (int): Timeout in seconds (applies per scan)
+
+        Returns:
+            list: Scan results in the same order as target_dirs
+        """
+        return await asyncio.gather(
+            *[self.scan_async(target_dir, options, timeout) for target_dir in target_dirs]
+        )
+
+    @staticmethod
+    def _dedup_finding_strings(findings):
+        """
+        Share repeated strings across findings in place
+
+        Large reports repeat the same rule IDs, file paths, commits and
+        author fields across thousands of findings; pointing them at one
+        shared str object cuts peak heap and makes downstream grouping
+        comparisons identity-fast.
+
+        Args:
+            findings (list): Parsed GitLeaks findings
+
+        Returns:
+            list: The same list, with repeated field values shared
+        """
+        seen = {}
+        keys = ("RuleID", "File", "Commit", "Author", "Email")
+        for finding in findings:
+            if not isinstance(finding, dict):
+                continue
+            for key in keys:
+                value = finding.get(key)
+                if isinstance(value, str):
+                    finding[key] = seen.setdefault(value, value)
+        return findings
+
+    def _process_results(self, process_result, use_stdout, output_file):
+        """
+        Turn a finished gitleaks process into a scan-result dict
+
+        Args:
+            process_result (dict): Result from run_process/run_process_async
+            use_stdout (bool): Whether the report arrived on stdout
+            output_file (str): Report file path when not using stdout
+
+        Returns:
+            dict: Scan results
+        """
         if process_result["success"] or process_result.get("exit_code") == 1:  # Exit code 1 means issues found
-            if os.path.exists(output_file):
+            if use_stdout:
                 try:
-                    with open(output_file, 'r') as f:
-                        # Parse JSON results
-                        gitleaks_results = json.load(f)
-                    
-                    # Remove temp file
-                    os.remove(output_file)
-                    
+                    report_text = process_result.get("stdout", "")
+                    if orjson is not None:
+                        gitleaks_results = orjson.loads(report_text)
+                    else:
+                        gitleaks_results = json.loads(report_text)
+
+                    if isinstance(gitleaks_results, list):
+                        self._dedup_finding_strings(gitleaks_results)
+
                     return {
                         "success": True,
                         "exit_code": process_result.get("exit_code", 0),
@@ -62,19 +204,56 @@ class GitLeaksScanner(BaseScanner):
                     }
                 except Exception as e:
                     self.logger.error(f"Error parsing GitLeaks results: {e}")
-                    if os.path.exists(output_file):
-                        os.remove(output_file)
                     return {
                         "success": False,
                         "error": f"Error parsing results: {str(e)}",
+                        "stderr": process_result.get("stderr", ""),
                         "execution_time": process_result.get("execution_time")
                     }
             else:
+                # EAFP: open directly and let FileNotFoundError take the
+                # missing-report branch instead of stat-ing first
+                try:
+                    # Parse JSON results; the report is a single array of
+                    # findings, so stream it item by item when ijson is
+                    # available instead of buffering file bytes + DOM at once
+                    with open(output_file, 'rb') as f:
+                        if ijson is not None:
+                            gitleaks_results = list(ijson.items(f, 'item'))
+                        elif orjson is not None:
+                            gitleaks_results = orjson.loads(f.read())
+                        else:
+                            gitleaks_results = json.load(f)
+                except FileNotFoundError:
+                    return {
+                        "success": False,
+                        "error": "GitLeaks output file not found",
+                        "stdout": process_result.get("stdout", ""),
+                        "stderr": process_result.get("stderr", ""),
+                        "execution_time": process_result.get("execution_time")
+                    }
+                except Exception as e:
+                    self.logger.error(f"Error parsing GitLeaks results: {e}")
+                    return {
+                        "success": False,
+                        "error": f"Error parsing results: {str(e)}",
+                        "execution_time": process_result.get("execution_time")
+                    }
+                finally:
+                    # Remove temp file; unlink under EAFP replaces the
+                    # second exists() check
+                    try:
+                        os.unlink(output_file)
+                    except FileNotFoundError:
+                        pass
+
+                if isinstance(gitleaks_results, list):
+                    self._dedup_finding_strings(gitleaks_results)
+
                 return {
-                    "success": False,
-                    "error": "GitLeaks output file not found",
-                    "stdout": process_result.get("stdout", ""),
-                    "stderr": process_result.get("stderr", ""),
+                    "success": True,
+                    "exit_code": process_result.get("exit_code", 0),
+                    "findings": gitleaks_results,
                     "execution_time": process_result.get("execution_time")
                 }
         else:
@@ -9,76 +9,220 @@
 4. 与测试任务相关的漏洞数据
 """
 
-import requests
-import json
 import argparse
+import hashlib
 import logging
+import pickle
 import sys
 import os
 import time
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 
 # 添加父目录到路径，以便能导入agent包中的模块
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from tests.config import API_URL
 
-# 配置日志
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler(os.path.join(os.path.dirname(__file__), 'logs', 'cleanup.log'))
-    ]
-)
 logger = logging.getLogger(__name__)
 
-# 确保日志目录存在
-os.makedirs(os.path.join(os.path.dirname(__file__), 'logs'), exist_ok=True)
+# orjson解析大响应比标准库json快数倍，未安装时回退到标准库
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _parse_json(response):
+    """解析响应体JSON（可用时走orjson的C解析器）"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+def _setup_logging():
+    """配置日志
+
+    仅在作为脚本运行时调用，避免--help或单纯导入判断函数时
+    创建日志目录和日志文件。文件日志经MemoryHandler缓冲后批量落盘，
+    把每条日志一次write的开销摊薄为每千条一次。
+    """
+    import atexit
+    from logging.handlers import MemoryHandler
+
+    log_dir = os.path.join(os.path.dirname(__file__), 'logs')
+    os.makedirs(log_dir, exist_ok=True)
+    file_handler = MemoryHandler(
+        1000,
+        target=logging.FileHandler(os.path.join(log_dir, 'cleanup.log'))
+    )
+    # 进程退出时把缓冲中剩余的日志写出
+    atexit.register(file_handler.flush)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.StreamHandler(sys.stdout),
+            file_handler
+        ]
+    )
+
+# 并发删除的线程数
+DELETE_WORKERS = 16
+
+# HTTP会话延迟创建：requests及其依赖（urllib3/ssl/certifi）导入开销明显，
+# --help或仅导入本模块的判断函数时无需支付
+_SESSION = None
+
+def _get_session():
+    """获取复用连接池的会话（首次调用时创建）
+
+    优先使用httpx的HTTP/2客户端：多个请求在一条TLS连接上多路复用，
+    省去每个连接的TCP/TLS握手。未安装httpx[http2]时回退到requests连接池，
+    两者的get/delete/post调用接口兼容。
+    """
+    global _SESSION
+    if _SESSION is None:
+        try:
+            import httpx
+            _SESSION = httpx.Client(
+                http2=True,
+                timeout=10.0,
+                limits=httpx.Limits(max_connections=32)
+            )
+            return _SESSION
+        except ImportError:
+            # httpx或h2未安装，回退到requests
+            pass
+
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        # 复用连接池：避免每个请求重新建立TCP/TLS连接
+        # 429/5xx时由Retry自动退避重试
+        _SESSION = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[429, 502, 503, 504])
+        )
+        _SESSION.mount('http://', adapter)
+        _SESSION.mount('https://', adapter)
+    return _SESSION
+
+# GET结果的本地缓存：测试迭代时脚本经常被反复执行，
+# TTL内直接复用上次已解析的数据，省去HTTPS往返和JSON解析
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'sast_cleanup')
+CACHE_TTL = 60  # 秒
+USE_CACHE = True  # --no-cache 时关闭
+
+def _cache_path(url):
+    return os.path.join(CACHE_DIR, hashlib.sha1(url.encode()).hexdigest() + '.pickle')
+
+def _cache_load(url, ttl=CACHE_TTL):
+    """读取URL对应的缓存对象，过期或不存在时返回None"""
+    if not USE_CACHE:
+        return None
+    path = _cache_path(url)
+    try:
+        with open(path, 'rb') as f:
+            timestamp, obj = pickle.load(f)
+        if time.time() - timestamp <= ttl:
+            logger.info(f"使用缓存结果：{url}")
+            return obj
+    except (OSError, pickle.PickleError, ValueError, EOFError):
+        pass
+    return None
+
+def _cache_store(url, obj):
+    """缓存URL对应的已解析对象"""
+    if not USE_CACHE:
+        return
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(_cache_path(url), 'wb') as f:
+            pickle.dump((time.time(), obj), f, pickle.HIGHEST_PROTOCOL)
+    except OSError as e:
+        logger.warning(f"写入缓存失败：{str(e)}")
+
+# ETag条件请求缓存：保存每个URL上次响应的ETag和已解析数据。
+# TTL缓存过期后带If-None-Match重新请求，列表未变时服务器只回304空响应，
+# 省掉完整JSON的传输和解析。与TTL缓存不同，304意味着数据已被服务器确认
+# 是最新的，所以该层不受--no-cache影响
+_ETAG_PATH = os.path.join(CACHE_DIR, 'etag.pkl')
+
+def _etag_load(url):
+    """读取URL对应的(etag, 已解析数据)，没有时返回(None, None)"""
+    try:
+        with open(_ETAG_PATH, 'rb') as f:
+            entries = pickle.load(f)
+        return entries.get(url, (None, None))
+    except (OSError, pickle.PickleError, ValueError, EOFError):
+        return (None, None)
+
+def _etag_store(url, etag, obj):
+    """记录URL最新响应的ETag和已解析数据"""
+    try:
+        try:
+            with open(_ETAG_PATH, 'rb') as f:
+                entries = pickle.load(f)
+        except (OSError, pickle.PickleError, ValueError, EOFError):
+            entries = {}
+        entries[url] = (etag, obj)
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(_ETAG_PATH, 'wb') as f:
+            pickle.dump(entries, f, pickle.HIGHEST_PROTOCOL)
+    except OSError as e:
+        logger.warning(f"写入ETag缓存失败：{str(e)}")
+
+def _get_list(url, key, label):
+    """GET一个列表接口，经过TTL缓存和ETag条件请求两层缓存"""
+    cached = _cache_load(url)
+    if cached is not None:
+        return cached
 
-def get_all_agents():
-    """获取所有代理"""
-    url = f"{API_URL}/agents"
     logger.info(f"GET {url}")
-    
+
     try:
-        response = requests.get(url)
+        etag, stale = _etag_load(url)
+        headers = {'If-None-Match': etag} if etag else None
+        response = _get_session().get(url, timeout=10, headers=headers)
+        if response.status_code == 304 and stale is not None:
+            # 列表未变化，直接复用上次解析结果
+            logger.info(f"服务器返回304，复用ETag缓存：{url}")
+            _cache_store(url, stale)
+            return stale
         if response.status_code == 200:
-            data = response.json()
-            return data.get('agents', [])
+            data = _parse_json(response)
+            items = data.get(key, [])
+            new_etag = response.headers.get('ETag')
+            if new_etag:
+                _etag_store(url, new_etag, items)
+            _cache_store(url, items)
+            return items
         else:
-            logger.error(f"获取代理失败：状态码{response.status_code}")
+            logger.error(f"获取{label}失败：状态码{response.status_code}")
             return []
     except Exception as e:
-        logger.error(f"获取代理时发生错误：{str(e)}")
+        logger.error(f"获取{label}时发生错误：{str(e)}")
         return []
 
+def get_all_agents():
+    """获取所有代理"""
+    return _get_list(f"{API_URL}/agents", 'agents', '代理')
+
 def get_all_tasks():
     """获取所有任务"""
-    url = f"{API_URL}/tasks"
-    logger.info(f"GET {url}")
-    
-    try:
-        response = requests.get(url)
-        if response.status_code == 200:
-            data = response.json()
-            return data.get('tasks', [])
-        else:
-            logger.error(f"获取任务失败：状态码{response.status_code}")
-            return []
-    except Exception as e:
-        logger.error(f"获取任务时发生错误：{str(e)}")
-        return []
+    return _get_list(f"{API_URL}/tasks", 'tasks', '任务')
 
 def delete_agent(agent_id):
     """删除指定的代理"""
     url = f"{API_URL}/agents/{agent_id}"
-    logger.info(f"DELETE {url}")
+    # 热路径上的逐条URL跟踪降为debug，默认级别下连格式化都省掉
+    logger.debug(f"DELETE {url}")
     
     try:
-        response = requests.delete(url)
+        response = _get_session().delete(url, timeout=10)
         if response.status_code == 200:
-            logger.info(f"成功删除代理：{agent_id}")
+            logger.debug(f"成功删除代理：{agent_id}")
             return True
         else:
             logger.error(f"删除代理失败：{agent_id}, 状态码{response.status_code}")
@@ -90,12 +234,12 @@ def delete_agent(agent_id):
 def delete_task(task_id):
     """删除指定的任务"""
     url = f"{API_URL}/tasks/{task_id}"
-    logger.info(f"DELETE {url}")
+    logger.debug(f"DELETE {url}")
     
     try:
-        response = requests.delete(url)
+        response = _get_session().delete(url, timeout=10)
         if response.status_code == 200:
-            logger.info(f"成功删除任务：{task_id}")
+            logger.debug(f"成功删除任务：{task_id}")
             return True
         else:
             logger.error(f"删除任务失败：{task_id}, 状态码{response.status_code}")
@@ -104,28 +248,69 @@ def delete_task(task_id):
         logger.error(f"删除任务时发生错误：{task_id}, {str(e)}")
         return False
 
+def bulk_delete(kind, ids):
+    """批量删除指定类型的资源
+
+    一次请求删除全部ID，避免每行数据一次网络往返。
+    返回删除数量；后端不支持批量接口时返回None（调用方应回退到逐个删除）。
+    """
+    if not ids:
+        return 0
+
+    url = f"{API_URL}/{kind}/bulk-delete"
+    logger.info(f"POST {url} ({len(ids)} 个ID)")
+
+    try:
+        response = _get_session().post(url, json={"ids": ids}, timeout=30)
+        if response.status_code == 200:
+            logger.info(f"成功批量删除 {len(ids)} 个{kind}")
+            return len(ids)
+        elif response.status_code in (404, 405):
+            logger.info(f"后端不支持批量删除{kind}接口，回退到逐个删除")
+            return None
+        else:
+            logger.error(f"批量删除{kind}失败：状态码{response.status_code}")
+            return None
+    except Exception as e:
+        logger.error(f"批量删除{kind}时发生错误：{str(e)}")
+        return None
+
+# 测试代理/任务的识别子串，预先全部小写，匹配时只做一次lower和一轮in扫描
+_AGENT_NEEDLES = ('test-agent', 'test_agent')
+_TASK_NEEDLES = (
+    'test/repo',
+    'test-repo',
+    'security-vulnerabilities',
+    'nodegoat',
+    'test',
+    'sast-console'
+)
+
 def is_test_agent(agent):
     """判断是否是测试代理"""
     if not agent or not isinstance(agent, dict):
         return False
-    
-    name = agent.get('name', '')
+
+    name = agent.get('name')
+    if not name:
+        return False
+
     # 测试代理通常包含'test-agent'或特定的测试标识
-    return 'test-agent' in name.lower() or 'test_agent' in name.lower()
+    name = name.lower()
+    return any(needle in name for needle in _AGENT_NEEDLES)
 
 def is_test_task(task):
     """判断是否是测试任务"""
     if not task or not isinstance(task, dict):
         return False
-    
-    repo_url = task.get('repository_url', '')
+
+    repo_url = task.get('repository_url')
+    if not repo_url:
+        return False
+
     # 测试任务通常使用特定的测试仓库URL
-    return ('test/repo' in repo_url.lower() or 
-            'test-repo' in repo_url.lower() or 
-            'security-vulnerabilities' in repo_url.lower() or
-            'nodegoat' in repo_url.lower() or
-            'test' in repo_url.lower() or
-            'sast-console' in repo_url.lower())
+    repo_url = repo_url.lower()
+    return any(needle in repo_url for needle in _TASK_NEEDLES)
 
 def parse_args():
     """解析命令行参数"""
@@ -136,24 +321,37 @@ def parse_args():
                         help='只清理测试代理数据')
     parser.add_argument('--tasks-only', action='store_true',
                         help='只清理测试任务数据')
-    parser.add_argument('--older-than', type=int, default=0, 
+    parser.add_argument('--older-than', type=int, default=0,
                         help='只清理早于指定天数的数据 (例如：--older-than 7 清理7天前的数据)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='不使用本地缓存，强制重新拉取代理和任务列表')
     return parser.parse_args()
 
-def is_older_than_days(date_str, days):
-    """判断日期是否早于指定天数"""
+def _is_older(date_str, cutoff_iso, cutoff):
+    """判断ISO格式时间串是否早于阈值
+
+    UTC的ISO-8601时间串可以直接按字典序比较，无需逐行解析；
+    只有形状异常的时间串才退回datetime.fromisoformat解析。
+
+    Args:
+        date_str: 待判断的ISO时间串
+        cutoff_iso: 阈值的ISO时间串（'%Y-%m-%dT%H:%M:%S'格式）
+        cutoff: 阈值的datetime对象（UTC，解析回退路径使用）
+    """
     if not date_str or not isinstance(date_str, str):
         return False
-    
+
+    # 快速路径：形状符合预期时按字典序比较
+    normalized = date_str[:-1] if date_str.endswith('Z') else date_str
+    if len(normalized) >= 19 and normalized[4] == '-' and normalized[10] == 'T':
+        return normalized < cutoff_iso
+
     try:
         # 处理ISO格式的日期时间字符串
-        date_str = date_str.replace('Z', '+00:00')
-        date_obj = datetime.fromisoformat(date_str)
-        
-        # 计算指定天数前的日期
-        cutoff_date = datetime.now() - timedelta(days=days)
-        
-        return date_obj < cutoff_date
+        date_obj = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+        if date_obj.tzinfo is None:
+            date_obj = date_obj.replace(tzinfo=timezone.utc)
+        return date_obj < cutoff
     except (ValueError, TypeError):
         return False
 
@@ -168,21 +366,32 @@ def cleanup_all_test_data(dry_run=False, agents_only=False, tasks_only=False, ol
     logger.info(f"获取到 {len(agents)} 个代理")
     logger.info(f"获取到 {len(tasks)} 个任务")
     
-    # 识别测试代理和与之相关的任务
-    test_agents = [agent for agent in agents if is_test_agent(agent)]
-    
-    # 如果指定了older_than_days，过滤出早于指定天数的代理
-    if older_than_days > 0:
-        test_agents = [agent for agent in test_agents if is_older_than_days(agent.get('created_at'), older_than_days)]
-    
-    test_agent_ids = [agent['id'] for agent in test_agents]
-    
-    # 识别测试任务（包括基于URL的和与测试代理相关的）
-    test_tasks = [task for task in tasks if is_test_task(task) or task.get('agent_id') in test_agent_ids]
-    
-    # 如果指定了older_than_days，过滤出早于指定天数的任务
+    # 时间阈值只计算一次，不在每行数据上重复计算
+    cutoff = cutoff_iso = None
     if older_than_days > 0:
-        test_tasks = [task for task in test_tasks if is_older_than_days(task.get('created_at'), older_than_days)]
+        cutoff = datetime.now(timezone.utc) - timedelta(days=older_than_days)
+        cutoff_iso = cutoff.strftime('%Y-%m-%dT%H:%M:%S')
+
+    # 识别测试代理：单次遍历同时完成分类、时间过滤和ID提取
+    # ID存入set，后面任务过滤时的membership判断为O(1)
+    test_agents = []
+    test_agent_ids = set()
+    for agent in agents:
+        if not is_test_agent(agent):
+            continue
+        if cutoff_iso and not _is_older(agent.get('created_at'), cutoff_iso, cutoff):
+            continue
+        test_agents.append(agent)
+        test_agent_ids.add(agent['id'])
+
+    # 识别测试任务（包括基于URL的和与测试代理相关的），同样单次遍历
+    test_tasks = []
+    for task in tasks:
+        if not (is_test_task(task) or task.get('agent_id') in test_agent_ids):
+            continue
+        if cutoff_iso and not _is_older(task.get('created_at'), cutoff_iso, cutoff):
+            continue
+        test_tasks.append(task)
     
     logger.info(f"识别到 {len(test_agents)} 个测试代理")
     logger.info(f"识别到 {len(test_tasks)} 个测试任务")
@@ -202,30 +411,31 @@ def cleanup_all_test_data(dry_run=False, agents_only=False, tasks_only=False, ol
         logger.info("[DRY RUN] 操作完成。实际运行时将删除这些数据。")
         return
     
-    # 先删除任务，因为任务可能引用代理
+    # 先删除任务，因为任务可能引用代理；全部任务删除完成后再删代理
     deleted_tasks = 0
     if not agents_only:
-        for task in test_tasks:
-            task_id = task.get('id')
-            if task_id and delete_task(task_id):
-                deleted_tasks += 1
-                # 短暂暂停，避免过多的请求
-                time.sleep(0.1)
-    
+        task_ids = [task.get('id') for task in test_tasks if task.get('id')]
+        deleted_tasks = bulk_delete("tasks", task_ids)
+        if deleted_tasks is None:
+            with ThreadPoolExecutor(max_workers=DELETE_WORKERS) as executor:
+                deleted_tasks = sum(executor.map(delete_task, task_ids))
+
     # 然后删除代理
     deleted_agents = 0
     if not tasks_only:
-        for agent in test_agents:
-            agent_id = agent.get('id')
-            if agent_id and delete_agent(agent_id):
-                deleted_agents += 1
-                # 短暂暂停，避免过多的请求
-                time.sleep(0.1)
+        agent_ids = [agent.get('id') for agent in test_agents if agent.get('id')]
+        deleted_agents = bulk_delete("agents", agent_ids)
+        if deleted_agents is None:
+            with ThreadPoolExecutor(max_workers=DELETE_WORKERS) as executor:
+                deleted_agents = sum(executor.map(delete_agent, agent_ids))
     
     logger.info(f"清理完成。删除了 {deleted_tasks} 个测试任务和 {deleted_agents} 个测试代理。")
 
 if __name__ == "__main__":
     args = parse_args()
+    _setup_logging()
+    if args.no_cache:
+        USE_CACHE = False
     cleanup_all_test_data(
         dry_run=args.dry_run, 
         agents_only=args.agents_only, 
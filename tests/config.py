@@ -2,6 +2,8 @@
 测试配置文件
 """
 
+import os
+
 # API基础URL配置
 # 本地开发环境URL
 LOCAL_API_URL = "http://localhost:3000/api"
@@ -9,6 +11,10 @@ LOCAL_API_URL = "http://localhost:3000/api"
 # 生产环境URL
 PROD_API_URL = "https://sast-console.vercel.app/api"
 
-# 当前使用的URL - 修改此变量来切换环境
-# 如果本地服务器没有运行，请使用PROD_API_URL
-API_URL = PROD_API_URL 
\ No newline at end of file
+# 当前使用的URL - 通过环境变量切换环境，避免改代码：
+#   SAST_API_URL  直接指定完整的API地址（优先级最高）
+#   SAST_ENV      local（默认，使用本地服务器）或其他值（使用生产环境）
+API_URL = os.environ.get(
+    "SAST_API_URL",
+    LOCAL_API_URL if os.environ.get("SAST_ENV", "local") == "local" else PROD_API_URL
+)
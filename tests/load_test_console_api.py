@@ -4,40 +4,99 @@ Load testing script for SAST Console API endpoints.
 Tests the API's performance under load by simulating multiple concurrent requests.
 """
 
-import requests
+import os
+import gzip
 import json
 import time
 import uuid
 import sys
+import array
+import asyncio
+import aiohttp
+import queue
 import logging
+import logging.handlers
 import argparse
-import threading
-import statistics
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
-# Configure logging
+# Configure logging: records go onto a queue and a single listener
+# thread does the file/console writes, keeping log I/O and handler-lock
+# contention out of the request coroutines
+_log_queue = queue.SimpleQueue()
+_log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+_log_file_handler = logging.FileHandler("logs/load_test.log")
+_log_file_handler.setFormatter(_log_formatter)
+_log_stream_handler = logging.StreamHandler(sys.stdout)
+_log_stream_handler.setFormatter(_log_formatter)
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, _log_file_handler, _log_stream_handler
+)
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("logs/load_test.log"),
-        logging.StreamHandler(sys.stdout)
-    ]
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
 )
+_log_listener.start()
 logger = logging.getLogger(__name__)
 
 # Base URL for the SAST Console
 BASE_URL = "https://sast-console.vercel.app/api"
 
+# Fixed endpoints, formatted once
+REGISTER_URL = f"{BASE_URL}/agents/register"
+AGENTS_URL = f"{BASE_URL}/agents"
+TASKS_URL = f"{BASE_URL}/tasks"
+
+# orjson encodes JSON several times faster than the stdlib; fall back
+# when it isn't installed
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj)
+
+    def _loads(data):
+        return orjson.loads(data)
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    def _loads(data):
+        return json.loads(data)
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_GZIP_JSON_HEADERS = {"Content-Type": "application/json", "Content-Encoding": "gzip"}
+
+# These bodies are identical for every agent/call, so build and encode
+# them once instead of per request
+UPDATE_AGENT_BODY = _dumps({
+    "status": "busy",
+    "capabilities": ["gitleaks", "codeql", "semgrep", "bandit"],
+    "system_info": {
+        "os": "Linux",
+        "version": "Ubuntu 22.04",
+        "cpu_cores": 8,
+        "memory": "16GB"
+    }
+})
+HEARTBEAT_BODY = _dumps({"status": "online"})
+
+# Registration fields shared by every synthetic agent
+AGENT_CAPABILITIES = ["gitleaks", "codeql", "semgrep"]
+AGENT_SYSTEM_INFO = {
+    "os": "Linux",
+    "version": "Ubuntu 22.04",
+    "cpu_cores": 4,
+    "memory": "8GB"
+}
+
 
 class SastConsoleLoadTester:
     """Class to perform load testing on SAST Console API endpoints."""
-    
+
     def __init__(self, num_agents=5, num_tasks_per_agent=2, num_concurrent=3):
         """
         Initialize the load tester.
-        
+
         Args:
             num_agents: Number of agents to create for testing
             num_tasks_per_agent: Number of tasks to create per agent
@@ -48,566 +107,613 @@ class SastConsoleLoadTester:
         self.num_concurrent = num_concurrent
         self.agents = []
         self.tasks = []
+        # array('d') stores samples as raw 8-byte doubles instead of
+        # boxed PyFloat objects, so big runs keep timings in one
+        # contiguous buffer
         self.response_times = {
-            "register_agent": [],
-            "get_agents": [],
-            "get_agent": [],
-            "update_agent": [],
-            "agent_heartbeat": [],
-            "create_task": [],
-            "get_tasks": [],
-            "get_task": [],
-            "update_task": [],
-            "submit_result": [],
-            "get_results": []
+            endpoint: array.array('d') for endpoint in (
+                "register_agent",
+                "get_agents",
+                "get_agent",
+                "update_agent",
+                "agent_heartbeat",
+                "create_task",
+                "get_tasks",
+                "get_task",
+                "update_task",
+                "submit_result",
+                "get_results"
+            )
         }
-        self.session = requests.Session()
-        self.lock = threading.Lock()
-    
+        self._sem = None
+        # Per-id URL tables, filled once after the creation phase
+        self._agent_urls = {}
+        self._heartbeat_urls = {}
+        self._task_urls = {}
+        self._result_urls = {}
+
+    def _record(self, key, duration):
+        """Record one response time sample.
+
+        All coroutines run on a single event loop thread, so plain list
+        appends are already serialized; no lock is needed on this path.
+        """
+        self.response_times[key].append(duration)
+
     def run_load_test(self):
         """Run the complete load test."""
+        try:
+            return asyncio.run(self._run_async())
+        finally:
+            # Drain whatever the listener thread hasn't written yet
+            _log_listener.stop()
+
+    async def _run_async(self):
+        """Run every test phase on one event loop with a shared session."""
         start_time = time.time()
         logger.info(f"=== Starting SAST Console API Load Test ===")
         logger.info(f"Configuration: {self.num_agents} agents, {self.num_tasks_per_agent} tasks per agent, {self.num_concurrent} concurrent requests")
-        
+
         try:
-            # Create agents
-            self._create_agents()
-            
-            # Get all agents (test endpoint under load)
-            self._test_get_agents_concurrently()
-            
-            # Get, update and heartbeat for agents concurrently
-            self._test_agent_operations_concurrently()
-            
-            # Create tasks for each agent
-            self._create_tasks()
-            
-            # Get all tasks (test endpoint under load)
-            self._test_get_tasks_concurrently()
-            
-            # Get and update tasks concurrently
-            self._test_task_operations_concurrently()
-            
-            # Submit and get results concurrently
-            self._test_results_operations_concurrently()
-            
+            # One semaphore and one session serve every phase, so the
+            # in-flight cap and warm connections carry across phases
+            # instead of being rebuilt seven times per run
+            self._sem = asyncio.Semaphore(self.num_concurrent)
+            # Size the connection pool to the concurrency level and keep
+            # sockets alive across phases so every request reuses a pooled
+            # TLS connection instead of re-handshaking
+            connector = aiohttp.TCPConnector(
+                limit=self.num_concurrent,
+                limit_per_host=self.num_concurrent,
+                ttl_dns_cache=300,
+                keepalive_timeout=75
+            )
+            async with aiohttp.ClientSession(
+                connector=connector,
+                headers={"Accept-Encoding": "gzip"}
+            ) as session:
+                # Create agents and, pipelined behind each successful
+                # registration, that agent's tasks
+                await self._create_agents_and_tasks(session)
+
+                # Format each per-id URL once; the later phases reuse
+                # every one of them several times
+                self._agent_urls = {a["id"]: f"{BASE_URL}/agents/{a['id']}" for a in self.agents}
+                self._heartbeat_urls = {a["id"]: f"{BASE_URL}/agents/{a['id']}/heartbeat" for a in self.agents}
+                self._task_urls = {t["id"]: f"{BASE_URL}/tasks/{t['id']}" for t in self.tasks}
+                self._result_urls = {t["id"]: f"{BASE_URL}/tasks/{t['id']}/results" for t in self.tasks}
+
+                # Get all agents (test endpoint under load)
+                await self._test_get_agents_concurrently(session)
+
+                # Get, update and heartbeat for agents concurrently
+                await self._test_agent_operations_concurrently(session)
+
+                # Get all tasks (test endpoint under load)
+                await self._test_get_tasks_concurrently(session)
+
+                # Get and update tasks concurrently
+                await self._test_task_operations_concurrently(session)
+
+                # Submit and get results concurrently
+                await self._test_results_operations_concurrently(session)
+
             # Print performance summary
             self._print_performance_summary()
-            
+
             duration = time.time() - start_time
             logger.info(f"=== Load Test Completed in {duration:.2f} seconds ===")
             return True
         except Exception as e:
             logger.error(f"Error during load test: {str(e)}")
             return False
-    
-    def _create_agents(self):
-        """Create the specified number of test agents."""
-        logger.info(f"Creating {self.num_agents} test agents...")
-        
-        with ThreadPoolExecutor(max_workers=self.num_concurrent) as executor:
-            futures = []
-            for i in range(self.num_agents):
-                agent_data = {
-                    "agent_id": str(uuid.uuid4()),
-                    "agent_name": f"Load Test Agent {i+1}-{str(uuid.uuid4())[:8]}",
-                    "status": "available",
-                    "capabilities": ["gitleaks", "codeql", "semgrep"],
-                    "ip_address": f"192.168.1.{100+i}",
-                    "system_info": {
-                        "os": "Linux",
-                        "version": "Ubuntu 22.04",
-                        "cpu_cores": 4,
-                        "memory": "8GB"
-                    }
-                }
-                futures.append(executor.submit(self._register_agent, agent_data))
-            
-            for future in as_completed(futures):
-                try:
-                    agent = future.result()
-                    if agent:
-                        with self.lock:
-                            self.agents.append(agent)
-                except Exception as e:
-                    logger.error(f"Error creating agent: {str(e)}")
-        
-        logger.info(f"Created {len(self.agents)} agents successfully")
-    
-    def _register_agent(self, agent_data):
+
+    async def _create_agents_and_tasks(self, session):
+        """Create the test agents and, overlapped, their tasks.
+
+        A task only depends on its own agent being registered, so task
+        creation for agent k starts the moment agent k's registration
+        returns instead of waiting for the whole agent phase to drain.
+        """
+        total_tasks = self.num_agents * self.num_tasks_per_agent
+        logger.info(f"Creating {self.num_agents} test agents and {total_tasks} tasks...")
+
+        # One urandom read supplies every agent id (vs two uuid4 syscalls
+        # per agent); the display-name suffix comes from the same id
+        raw = os.urandom(16 * self.num_agents)
+
+        coros = []
+        for i in range(self.num_agents):
+            agent_id = str(uuid.UUID(bytes=raw[i * 16:(i + 1) * 16], version=4))
+            agent_data = {
+                "agent_id": agent_id,
+                "agent_name": f"Load Test Agent {i+1}-{agent_id[:8]}",
+                "status": "available",
+                "capabilities": AGENT_CAPABILITIES,
+                "ip_address": f"192.168.1.{100+i}",
+                "system_info": AGENT_SYSTEM_INFO
+            }
+            coros.append(self._register_and_create_tasks(session, agent_data))
+
+        # Consume registrations as they finish so each response payload
+        # can be released immediately instead of piling up in one big
+        # gathered result list
+        for future in asyncio.as_completed(coros):
+            try:
+                await future
+            except Exception as e:
+                logger.error(f"Error creating agent: {str(e)}")
+
+        logger.info(f"Created {len(self.agents)} agents and {len(self.tasks)} tasks successfully")
+
+    async def _register_and_create_tasks(self, session, agent_data):
+        """Register one agent, then immediately create its tasks."""
+        agent = await self._register_agent(session, agent_data)
+        if agent:
+            self.agents.append(agent)
+            await self._create_tasks_for_agent(session, agent)
+
+    async def _create_tasks_for_agent(self, session, agent):
+        """Create this agent's share of tasks concurrently."""
+        coros = []
+        for i in range(self.num_tasks_per_agent):
+            task_data = {
+                "agent_id": agent["id"],
+                "repository_url": f"https://github.com/username/repo-{i+1}",
+                "branch": "main",
+                "scanners": ["gitleaks", "codeql"],
+                "created_by": "load-test"
+            }
+            coros.append(self._create_task(session, task_data))
+
+        for future in asyncio.as_completed(coros):
+            try:
+                task = await future
+            except Exception as e:
+                logger.error(f"Error creating task: {str(e)}")
+            else:
+                if task:
+                    self.tasks.append(task)
+
+    async def _register_agent(self, session, agent_data):
         """Register a new agent and record the response time."""
-        start_time = time.time()
-        
         try:
-            response = self.session.post(f"{BASE_URL}/agents/register", json=agent_data)
-            duration = time.time() - start_time
-            
-            if response.status_code == 200:
-                agent = response.json().get("agent")
-                logger.debug(f"Registered agent: {agent['name']} (ID: {agent['id']}) in {duration:.3f}s")
-                with self.lock:
-                    self.response_times["register_agent"].append(duration)
-                return agent
-            else:
-                logger.error(f"Failed to register agent: {response.status_code} - {response.text}")
-                return None
+            async with self._sem:
+                start_time = time.perf_counter()
+                async with session.post(REGISTER_URL, data=_dumps(agent_data), headers=_JSON_HEADERS) as response:
+                    duration = time.perf_counter() - start_time
+
+                    if response.status == 200:
+                        agent = (await response.json()).get("agent")
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(f"Registered agent: {agent['name']} (ID: {agent['id']}) in {duration:.3f}s")
+                        self._record("register_agent", duration)
+                        return agent
+                    else:
+                        logger.error(f"Failed to register agent: {response.status} - {await response.text()}")
+                        return None
         except Exception as e:
             logger.error(f"Exception during agent registration: {str(e)}")
             return None
-    
-    def _test_get_agents_concurrently(self):
+
+    async def _test_get_agents_concurrently(self, session):
         """Test getting all agents with concurrent requests."""
         logger.info("Testing GET /agents with concurrent requests...")
-        
-        with ThreadPoolExecutor(max_workers=self.num_concurrent) as executor:
-            futures = [executor.submit(self._get_all_agents) for _ in range(self.num_concurrent)]
-            for future in as_completed(futures):
-                try:
-                    future.result()
-                except Exception as e:
-                    logger.error(f"Error getting agents: {str(e)}")
-    
-    def _get_all_agents(self):
+
+        coros = [self._get_all_agents(session) for _ in range(self.num_concurrent)]
+        for future in asyncio.as_completed(coros):
+            try:
+                await future
+            except Exception as e:
+                logger.error(f"Error getting agents: {str(e)}")
+
+    async def _get_all_agents(self, session):
         """Get all agents and record the response time."""
-        start_time = time.time()
-        
         try:
-            response = self.session.get(f"{BASE_URL}/agents")
-            duration = time.time() - start_time
-            
-            with self.lock:
-                self.response_times["get_agents"].append(duration)
-            
-            if response.status_code == 200:
-                agents = response.json().get("agents", [])
-                logger.debug(f"Got {len(agents)} agents in {duration:.3f}s")
-                return agents
-            else:
-                logger.error(f"Failed to get agents: {response.status_code} - {response.text}")
-                return []
+            async with self._sem:
+                start_time = time.perf_counter()
+                async with session.get(AGENTS_URL) as response:
+                    duration = time.perf_counter() - start_time
+
+                    self._record("get_agents", duration)
+
+                    if response.status == 200:
+                        # Drain the body so the connection stays reusable,
+                        # but only pay for the JSON parse when the count
+                        # is actually logged
+                        raw = await response.read()
+                        if logger.isEnabledFor(logging.DEBUG):
+                            agents = _loads(raw).get("agents", [])
+                            logger.debug(f"Got {len(agents)} agents in {duration:.3f}s")
+                            return agents
+                        return []
+                    else:
+                        logger.error(f"Failed to get agents: {response.status} - {await response.text()}")
+                        return []
         except Exception as e:
             logger.error(f"Exception getting agents: {str(e)}")
             return []
-    
-    def _test_agent_operations_concurrently(self):
+
+    async def _test_agent_operations_concurrently(self, session):
         """Test agent operations (get, update, heartbeat) concurrently."""
         if not self.agents:
             logger.warning("No agents to test operations on")
             return
-        
+
         logger.info(f"Testing agent operations concurrently on {len(self.agents)} agents...")
-        
-        with ThreadPoolExecutor(max_workers=self.num_concurrent) as executor:
-            futures = []
-            
-            # Get agent details
-            for agent in self.agents:
-                futures.append(executor.submit(self._get_agent, agent["id"]))
-            
-            # Update agents
-            for agent in self.agents:
-                update_data = {
-                    "status": "busy",
-                    "capabilities": ["gitleaks", "codeql", "semgrep", "bandit"],
-                    "system_info": {
-                        "os": "Linux",
-                        "version": "Ubuntu 22.04",
-                        "cpu_cores": 8,
-                        "memory": "16GB"
-                    }
-                }
-                futures.append(executor.submit(self._update_agent, agent["id"], update_data))
-            
-            # Send heartbeats
-            for agent in self.agents:
-                futures.append(executor.submit(self._agent_heartbeat, agent["id"]))
-            
-            # Wait for all operations to complete
-            for future in as_completed(futures):
-                try:
-                    future.result()
-                except Exception as e:
-                    logger.error(f"Error in agent operation: {str(e)}")
-    
-    def _get_agent(self, agent_id):
+
+        # Issue each agent's three operations together so they ride the
+        # same warm connection back-to-back instead of being spread
+        # across the whole phase
+        coros = [self._agent_ops(session, agent["id"]) for agent in self.agents]
+
+        # Wait for all operations to complete, dropping each result as
+        # soon as it arrives
+        for future in asyncio.as_completed(coros):
+            try:
+                await future
+            except Exception as e:
+                logger.error(f"Error in agent operation: {str(e)}")
+
+    async def _agent_ops(self, session, agent_id):
+        """Run the get/update/heartbeat trio for one agent concurrently."""
+        await asyncio.gather(
+            self._get_agent(session, agent_id),
+            self._update_agent(session, agent_id, UPDATE_AGENT_BODY),
+            self._agent_heartbeat(session, agent_id)
+        )
+
+    async def _get_agent(self, session, agent_id):
         """Get a specific agent and record the response time."""
-        start_time = time.time()
-        
         try:
-            response = self.session.get(f"{BASE_URL}/agents/{agent_id}")
-            duration = time.time() - start_time
-            
-            with self.lock:
-                self.response_times["get_agent"].append(duration)
-            
-            if response.status_code == 200:
-                agent = response.json().get("agent")
-                logger.debug(f"Got agent {agent_id} in {duration:.3f}s")
-                return agent
-            else:
-                logger.error(f"Failed to get agent {agent_id}: {response.status_code} - {response.text}")
-                return None
+            async with self._sem:
+                start_time = time.perf_counter()
+                async with session.get(self._agent_urls[agent_id]) as response:
+                    duration = time.perf_counter() - start_time
+
+                    self._record("get_agent", duration)
+
+                    if response.status == 200:
+                        agent = (await response.json()).get("agent")
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(f"Got agent {agent_id} in {duration:.3f}s")
+                        return agent
+                    else:
+                        logger.error(f"Failed to get agent {agent_id}: {response.status} - {await response.text()}")
+                        return None
         except Exception as e:
             logger.error(f"Exception getting agent {agent_id}: {str(e)}")
             return None
-    
-    def _update_agent(self, agent_id, update_data):
+
+    async def _update_agent(self, session, agent_id, body):
         """Update an agent and record the response time."""
-        start_time = time.time()
-        
         try:
-            response = self.session.patch(f"{BASE_URL}/agents/{agent_id}", json=update_data)
-            duration = time.time() - start_time
-            
-            with self.lock:
-                self.response_times["update_agent"].append(duration)
-            
-            if response.status_code == 200:
-                agent = response.json().get("agent")
-                logger.debug(f"Updated agent {agent_id} in {duration:.3f}s")
-                return agent
-            else:
-                logger.error(f"Failed to update agent {agent_id}: {response.status_code} - {response.text}")
-                return None
+            async with self._sem:
+                start_time = time.perf_counter()
+                async with session.patch(self._agent_urls[agent_id], data=body, headers=_JSON_HEADERS) as response:
+                    duration = time.perf_counter() - start_time
+
+                    self._record("update_agent", duration)
+
+                    if response.status == 200:
+                        agent = (await response.json()).get("agent")
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(f"Updated agent {agent_id} in {duration:.3f}s")
+                        return agent
+                    else:
+                        logger.error(f"Failed to update agent {agent_id}: {response.status} - {await response.text()}")
+                        return None
         except Exception as e:
             logger.error(f"Exception updating agent {agent_id}: {str(e)}")
             return None
-    
-    def _agent_heartbeat(self, agent_id):
+
+    async def _agent_heartbeat(self, session, agent_id):
         """Send a heartbeat for an agent and record the response time."""
-        start_time = time.time()
-        
         try:
-            # Send heartbeat with status
-            heartbeat_data = {
-                "status": "online"
-            }
-            response = self.session.post(f"{BASE_URL}/agents/{agent_id}/heartbeat", json=heartbeat_data)
-            duration = time.time() - start_time
-            
-            with self.lock:
-                self.response_times["agent_heartbeat"].append(duration)
-            
-            if response.status_code == 200:
-                logger.debug(f"Sent heartbeat for agent {agent_id} in {duration:.3f}s")
-                return True
-            else:
-                logger.error(f"Failed to send heartbeat for agent {agent_id}: {response.status_code} - {response.text}")
-                return False
+            async with self._sem:
+                start_time = time.perf_counter()
+                async with session.post(self._heartbeat_urls[agent_id], data=HEARTBEAT_BODY, headers=_JSON_HEADERS) as response:
+                    duration = time.perf_counter() - start_time
+
+                    self._record("agent_heartbeat", duration)
+
+                    if response.status == 200:
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(f"Sent heartbeat for agent {agent_id} in {duration:.3f}s")
+                        return True
+                    else:
+                        logger.error(f"Failed to send heartbeat for agent {agent_id}: {response.status} - {await response.text()}")
+                        return False
         except Exception as e:
             logger.error(f"Exception sending heartbeat for agent {agent_id}: {str(e)}")
             return False
-    
-    def _create_tasks(self):
-        """Create tasks for each agent."""
-        if not self.agents:
-            logger.warning("No agents to create tasks for")
-            return
-        
-        total_tasks = len(self.agents) * self.num_tasks_per_agent
-        logger.info(f"Creating {total_tasks} tasks ({self.num_tasks_per_agent} for each of {len(self.agents)} agents)...")
-        
-        with ThreadPoolExecutor(max_workers=self.num_concurrent) as executor:
-            futures = []
-            
-            for agent in self.agents:
-                for i in range(self.num_tasks_per_agent):
-                    task_data = {
-                        "agent_id": agent["id"],
-                        "repository_url": f"https://github.com/username/repo-{i+1}",
-                        "branch": "main",
-                        "scanners": ["gitleaks", "codeql"],
-                        "created_by": "load-test"
-                    }
-                    futures.append(executor.submit(self._create_task, task_data))
-            
-            for future in as_completed(futures):
-                try:
-                    task = future.result()
-                    if task:
-                        with self.lock:
-                            self.tasks.append(task)
-                except Exception as e:
-                    logger.error(f"Error creating task: {str(e)}")
-        
-        logger.info(f"Created {len(self.tasks)} tasks successfully")
-    
-    def _create_task(self, task_data):
+
+    async def _create_task(self, session, task_data):
         """Create a task and record the response time."""
-        start_time = time.time()
-        
         try:
-            response = self.session.post(f"{BASE_URL}/tasks", json=task_data)
-            duration = time.time() - start_time
-            
-            with self.lock:
-                self.response_times["create_task"].append(duration)
-            
-            if response.status_code == 200:
-                task = response.json().get("task")
-                logger.debug(f"Created task for agent {task_data['agent_id']} in {duration:.3f}s")
-                return task
-            else:
-                logger.error(f"Failed to create task: {response.status_code} - {response.text}")
-                return None
+            async with self._sem:
+                start_time = time.perf_counter()
+                async with session.post(TASKS_URL, data=_dumps(task_data), headers=_JSON_HEADERS) as response:
+                    duration = time.perf_counter() - start_time
+
+                    self._record("create_task", duration)
+
+                    if response.status == 200:
+                        task = (await response.json()).get("task")
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(f"Created task for agent {task_data['agent_id']} in {duration:.3f}s")
+                        return task
+                    else:
+                        logger.error(f"Failed to create task: {response.status} - {await response.text()}")
+                        return None
         except Exception as e:
             logger.error(f"Exception creating task: {str(e)}")
             return None
-    
-    def _test_get_tasks_concurrently(self):
+
+    async def _test_get_tasks_concurrently(self, session):
         """Test getting all tasks with concurrent requests."""
         logger.info("Testing GET /tasks with concurrent requests...")
-        
-        with ThreadPoolExecutor(max_workers=self.num_concurrent) as executor:
-            futures = [executor.submit(self._get_all_tasks) for _ in range(self.num_concurrent)]
-            for future in as_completed(futures):
-                try:
-                    future.result()
-                except Exception as e:
-                    logger.error(f"Error getting tasks: {str(e)}")
-    
-    def _get_all_tasks(self):
+
+        coros = [self._get_all_tasks(session) for _ in range(self.num_concurrent)]
+        for future in asyncio.as_completed(coros):
+            try:
+                await future
+            except Exception as e:
+                logger.error(f"Error getting tasks: {str(e)}")
+
+    async def _get_all_tasks(self, session):
         """Get all tasks and record the response time."""
-        start_time = time.time()
-        
         try:
-            response = self.session.get(f"{BASE_URL}/tasks")
-            duration = time.time() - start_time
-            
-            with self.lock:
-                self.response_times["get_tasks"].append(duration)
-            
-            if response.status_code == 200:
-                tasks = response.json().get("tasks", [])
-                logger.debug(f"Got {len(tasks)} tasks in {duration:.3f}s")
-                return tasks
-            else:
-                logger.error(f"Failed to get tasks: {response.status_code} - {response.text}")
-                return []
+            async with self._sem:
+                start_time = time.perf_counter()
+                async with session.get(TASKS_URL) as response:
+                    duration = time.perf_counter() - start_time
+
+                    self._record("get_tasks", duration)
+
+                    if response.status == 200:
+                        raw = await response.read()
+                        if logger.isEnabledFor(logging.DEBUG):
+                            tasks = _loads(raw).get("tasks", [])
+                            logger.debug(f"Got {len(tasks)} tasks in {duration:.3f}s")
+                            return tasks
+                        return []
+                    else:
+                        logger.error(f"Failed to get tasks: {response.status} - {await response.text()}")
+                        return []
         except Exception as e:
             logger.error(f"Exception getting tasks: {str(e)}")
             return []
-    
-    def _test_task_operations_concurrently(self):
+
+    async def _test_task_operations_concurrently(self, session):
         """Test task operations (get, update) concurrently."""
         if not self.tasks:
             logger.warning("No tasks to test operations on")
             return
-        
+
         logger.info(f"Testing task operations concurrently on {len(self.tasks)} tasks...")
-        
-        with ThreadPoolExecutor(max_workers=self.num_concurrent) as executor:
-            futures = []
-            
-            # Get task details
-            for task in self.tasks:
-                futures.append(executor.submit(self._get_task, task["id"]))
-            
-            # Update tasks
-            for task in self.tasks:
-                update_data = {
-                    "status": "in_progress",
-                    "started_at": datetime.utcnow().isoformat() + "Z"
-                }
-                futures.append(executor.submit(self._update_task, task["id"], update_data))
-            
-            # Wait for all operations to complete
-            for future in as_completed(futures):
-                try:
-                    future.result()
-                except Exception as e:
-                    logger.error(f"Error in task operation: {str(e)}")
-    
-    def _get_task(self, task_id):
+
+        coros = []
+
+        # Get task details
+        for task in self.tasks:
+            coros.append(self._get_task(session, task["id"]))
+
+        # Update tasks; the body (timestamp included) is the same for
+        # every task in this phase, so encode it once
+        update_body = _dumps({
+            "status": "in_progress",
+            "started_at": datetime.utcnow().isoformat() + "Z"
+        })
+        for task in self.tasks:
+            coros.append(self._update_task(session, task["id"], update_body))
+
+        # Wait for all operations to complete, dropping each result as
+        # soon as it arrives
+        for future in asyncio.as_completed(coros):
+            try:
+                await future
+            except Exception as e:
+                logger.error(f"Error in task operation: {str(e)}")
+
+    async def _get_task(self, session, task_id):
         """Get a specific task and record the response time."""
-        start_time = time.time()
-        
         try:
-            response = self.session.get(f"{BASE_URL}/tasks/{task_id}")
-            duration = time.time() - start_time
-            
-            with self.lock:
-                self.response_times["get_task"].append(duration)
-            
-            if response.status_code == 200:
-                task = response.json().get("task")
-                logger.debug(f"Got task {task_id} in {duration:.3f}s")
-                return task
-            else:
-                logger.error(f"Failed to get task {task_id}: {response.status_code} - {response.text}")
-                return None
+            async with self._sem:
+                start_time = time.perf_counter()
+                async with session.get(self._task_urls[task_id]) as response:
+                    duration = time.perf_counter() - start_time
+
+                    self._record("get_task", duration)
+
+                    if response.status == 200:
+                        task = (await response.json()).get("task")
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(f"Got task {task_id} in {duration:.3f}s")
+                        return task
+                    else:
+                        logger.error(f"Failed to get task {task_id}: {response.status} - {await response.text()}")
+                        return None
         except Exception as e:
             logger.error(f"Exception getting task {task_id}: {str(e)}")
             return None
-    
-    def _update_task(self, task_id, update_data):
+
+    async def _update_task(self, session, task_id, body):
         """Update a task and record the response time."""
-        start_time = time.time()
-        
         try:
-            response = self.session.patch(f"{BASE_URL}/tasks/{task_id}", json=update_data)
-            duration = time.time() - start_time
-            
-            with self.lock:
-                self.response_times["update_task"].append(duration)
-            
-            if response.status_code == 200:
-                task = response.json().get("task")
-                logger.debug(f"Updated task {task_id} in {duration:.3f}s")
-                return task
-            else:
-                logger.error(f"Failed to update task {task_id}: {response.status_code} - {response.text}")
-                return None
+            async with self._sem:
+                start_time = time.perf_counter()
+                async with session.patch(self._task_urls[task_id], data=body, headers=_JSON_HEADERS) as response:
+                    duration = time.perf_counter() - start_time
+
+                    self._record("update_task", duration)
+
+                    if response.status == 200:
+                        # The caller never looks at the updated task, so
+                        # skip the JSON parse and just drain the body
+                        await response.read()
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(f"Updated task {task_id} in {duration:.3f}s")
+                        return True
+                    else:
+                        logger.error(f"Failed to update task {task_id}: {response.status} - {await response.text()}")
+                        return None
         except Exception as e:
             logger.error(f"Exception updating task {task_id}: {str(e)}")
             return None
-    
-    def _test_results_operations_concurrently(self):
+
+    async def _test_results_operations_concurrently(self, session):
         """Test result operations (submit, get) concurrently."""
         if not self.tasks:
             logger.warning("No tasks to test result operations on")
             return
-        
+
         logger.info(f"Testing result operations concurrently on {len(self.tasks)} tasks...")
-        
-        with ThreadPoolExecutor(max_workers=self.num_concurrent) as executor:
-            futures = []
-            
-            # Submit results
-            for task in self.tasks:
-                result_data = {
-                    "agent_id": task["agent_id"],
-                    "status": "success",
-                    "start_time": datetime.utcnow().isoformat() + "Z",
-                    "end_time": datetime.utcnow().isoformat() + "Z",
-                    "scan_results": {
-                        "scanner": "gitleaks",
-                        "findings_count": 3,
-                        "findings": [
-                            {
-                                "type": "AWS Secret Key",
-                                "file": "config.js",
-                                "line": 42,
-                                "severity": "high"
-                            },
-                            {
-                                "type": "Password",
-                                "file": "settings.json",
-                                "line": 17,
-                                "severity": "medium"
-                            },
-                            {
-                                "type": "API Key",
-                                "file": "api/client.js",
-                                "line": 5,
-                                "severity": "critical"
-                            }
-                        ]
+
+        # Submit results; everything except agent_id is identical across
+        # tasks, so build the template (and its timestamp) once
+        now = datetime.utcnow().isoformat() + "Z"
+        result_template = {
+            "status": "success",
+            "start_time": now,
+            "end_time": now,
+            "scan_results": {
+                "scanner": "gitleaks",
+                "findings_count": 3,
+                "findings": [
+                    {
+                        "type": "AWS Secret Key",
+                        "file": "config.js",
+                        "line": 42,
+                        "severity": "high"
+                    },
+                    {
+                        "type": "Password",
+                        "file": "settings.json",
+                        "line": 17,
+                        "severity": "medium"
+                    },
+                    {
+                        "type": "API Key",
+                        "file": "api/client.js",
+                        "line": 5,
+                        "severity": "critical"
                     }
-                }
-                futures.append(executor.submit(self._submit_result, task["id"], result_data))
-            
-            # Wait for all submissions to complete
-            for future in as_completed(futures):
-                try:
-                    future.result()
-                except Exception as e:
-                    logger.error(f"Error in result submission: {str(e)}")
-            
-            # Get results
-            futures = []
-            for task in self.tasks:
-                futures.append(executor.submit(self._get_results, task["id"]))
-            
-            # Wait for all get results to complete
-            for future in as_completed(futures):
-                try:
-                    future.result()
-                except Exception as e:
-                    logger.error(f"Error in get results: {str(e)}")
-    
-    def _submit_result(self, task_id, result_data):
+                ]
+            }
+        }
+        coros = []
+        for task in self.tasks:
+            # Findings bodies are the largest payloads in the test; gzip
+            # at the fastest level cuts most of the bytes on the wire
+            body = gzip.compress(_dumps({**result_template, "agent_id": task["agent_id"]}), compresslevel=1)
+            coros.append(self._submit_result(session, task["id"], body))
+
+        # Wait for all submissions to complete
+        for future in asyncio.as_completed(coros):
+            try:
+                await future
+            except Exception as e:
+                logger.error(f"Error in result submission: {str(e)}")
+
+        # Get results
+        coros = [self._get_results(session, task["id"]) for task in self.tasks]
+
+        # Wait for all get results to complete
+        for future in asyncio.as_completed(coros):
+            try:
+                await future
+            except Exception as e:
+                logger.error(f"Error in get results: {str(e)}")
+
+    async def _submit_result(self, session, task_id, body):
         """Submit a result for a task and record the response time."""
-        start_time = time.time()
-        
         try:
-            response = self.session.post(f"{BASE_URL}/tasks/{task_id}/results", json=result_data)
-            duration = time.time() - start_time
-            
-            with self.lock:
-                self.response_times["submit_result"].append(duration)
-            
-            if response.status_code in [200, 201]:
-                logger.debug(f"Submitted result for task {task_id} in {duration:.3f}s")
-                return True
-            else:
-                logger.error(f"Failed to submit result for task {task_id}: {response.status_code} - {response.text}")
-                return False
+            async with self._sem:
+                start_time = time.perf_counter()
+                async with session.post(self._result_urls[task_id], data=body, headers=_GZIP_JSON_HEADERS) as response:
+                    duration = time.perf_counter() - start_time
+
+                    self._record("submit_result", duration)
+
+                    if response.status in [200, 201]:
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(f"Submitted result for task {task_id} in {duration:.3f}s")
+                        return True
+                    else:
+                        logger.error(f"Failed to submit result for task {task_id}: {response.status} - {await response.text()}")
+                        return False
         except Exception as e:
             logger.error(f"Exception submitting result for task {task_id}: {str(e)}")
             return False
-    
-    def _get_results(self, task_id):
+
+    async def _get_results(self, session, task_id):
         """Get results for a task and record the response time."""
-        start_time = time.time()
-        
         try:
-            response = self.session.get(f"{BASE_URL}/tasks/{task_id}/results")
-            duration = time.time() - start_time
-            
-            with self.lock:
-                self.response_times["get_results"].append(duration)
-            
-            if response.status_code == 200:
-                results = response.json().get("result")
-                logger.debug(f"Got results for task {task_id} in {duration:.3f}s")
-                return results
-            else:
-                logger.error(f"Failed to get results for task {task_id}: {response.status_code} - {response.text}")
-                return []
+            async with self._sem:
+                start_time = time.perf_counter()
+                async with session.get(self._result_urls[task_id]) as response:
+                    duration = time.perf_counter() - start_time
+
+                    self._record("get_results", duration)
+
+                    if response.status == 200:
+                        results = (await response.json()).get("result")
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(f"Got results for task {task_id} in {duration:.3f}s")
+                        return results
+                    else:
+                        logger.error(f"Failed to get results for task {task_id}: {response.status} - {await response.text()}")
+                        return []
         except Exception as e:
             logger.error(f"Exception getting results for task {task_id}: {str(e)}")
             return []
-    
+
+    @staticmethod
+    def _summarize(times):
+        """Compute (count, min, max, avg, median, p95) from one sorted pass.
+
+        Sorting once and indexing gives every order statistic without the
+        separate re-sorts statistics.median and the old p95 slice did,
+        and the clamped index keeps p95 in range for tiny samples.
+        """
+        ordered = sorted(times)
+        count = len(ordered)
+        if count % 2:
+            median = ordered[count // 2]
+        else:
+            median = (ordered[count // 2 - 1] + ordered[count // 2]) / 2
+        percentile_95 = ordered[min(int(count * 0.95), count - 1)]
+        return count, ordered[0], ordered[-1], sum(ordered) / count, median, percentile_95
+
     def _print_performance_summary(self):
         """Print a summary of the performance metrics."""
         logger.info("=== Performance Summary ===")
         logger.info(f"Total agents created: {len(self.agents)}")
         logger.info(f"Total tasks created: {len(self.tasks)}")
-        
+
         # Print table header
         logger.info("\nEndpoint Performance (seconds):")
         logger.info(f"{'Endpoint':<20} {'Count':<8} {'Min':<8} {'Max':<8} {'Avg':<8} {'Median':<8} {'95%':<8}")
         logger.info("-" * 70)
-        
+
         # Print metrics for each endpoint
         for endpoint, times in self.response_times.items():
             if not times:
                 continue
-                
-            count = len(times)
-            min_time = min(times)
-            max_time = max(times)
-            avg_time = sum(times) / count
-            median_time = statistics.median(times)
-            percentile_95 = sorted(times)[int(count * 0.95)] if count > 1 else max_time
-            
+
+            count, min_time, max_time, avg_time, median_time, percentile_95 = self._summarize(times)
+
             logger.info(f"{endpoint:<20} {count:<8d} {min_time:<8.3f} {max_time:<8.3f} {avg_time:<8.3f} {median_time:<8.3f} {percentile_95:<8.3f}")
-        
+
         # Calculate overall statistics
-        all_times = []
+        all_times = array.array('d')
         for times in self.response_times.values():
             all_times.extend(times)
-        
+
         if all_times:
-            count = len(all_times)
-            min_time = min(all_times)
-            max_time = max(all_times)
-            avg_time = sum(all_times) / count
-            median_time = statistics.median(all_times)
-            percentile_95 = sorted(all_times)[int(count * 0.95)] if count > 1 else max_time
-            
+            count, min_time, max_time, avg_time, median_time, percentile_95 = self._summarize(all_times)
+
             logger.info("-" * 70)
             logger.info(f"{'OVERALL':<20} {count:<8d} {min_time:<8.3f} {max_time:<8.3f} {avg_time:<8.3f} {median_time:<8.3f} {percentile_95:<8.3f}")
 
@@ -632,4 +738,4 @@ if __name__ == "__main__":
         num_concurrent=args.concurrent
     )
     success = tester.run_load_test()
-    sys.exit(0 if success else 1) 
\ No newline at end of file
+    sys.exit(0 if success else 1)
@@ -8,9 +8,12 @@ and provide a summary of the results.
 import os
 import sys
 import time
-import subprocess
+import atexit
+import asyncio
+import tempfile
 import argparse
 import logging
+import logging.handlers
 from datetime import datetime
 
 # 获取当前脚本目录
@@ -20,64 +23,104 @@ LOG_DIR = os.path.join(SCRIPT_DIR, "logs")
 # 确保日志目录存在
 os.makedirs(LOG_DIR, exist_ok=True)
 
-# Configure logging
+# Configure logging; the file handler sits behind a MemoryHandler so
+# records hit disk in batches instead of one write per line, with an
+# atexit flush for whatever is still buffered at exit
+_file_handler = logging.handlers.MemoryHandler(
+    1000,
+    target=logging.FileHandler(os.path.join(LOG_DIR, "all_tests.log"))
+)
+atexit.register(_file_handler.flush)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler(os.path.join(LOG_DIR, "all_tests.log")),
+        _file_handler,
         logging.StreamHandler(sys.stdout)
     ]
 )
 logger = logging.getLogger(__name__)
 
-def run_test(test_script, args=None):
-    """Run a test script and return the result."""
-    start_time = time.time()
+# Child suites only need a handful of variables: the basics to locate
+# the interpreter and imports, PYTHONUNBUFFERED so captured output
+# arrives promptly, and the SAST_* switches that tests/config.py reads.
+# Passing this instead of the full parent environment keeps child
+# startup cheap and runs reproducible.
+_CHILD_ENV = {
+    key: os.environ[key]
+    for key in ("PATH", "PYTHONPATH", "HOME", "SYSTEMROOT",
+                "SAST_API_URL", "SAST_ENV")
+    if key in os.environ
+}
+_CHILD_ENV["PYTHONUNBUFFERED"] = "1"
+
+async def run_test(test_script, args=None):
+    """Run a test script as a child process and return the result."""
+    start_time = time.monotonic()
     cmd = [sys.executable, test_script]
     if args:
         cmd.extend(args)
     
     logger.info(f"Running {test_script} with args: {args if args else 'none'}")
     
+    # The suites mirror everything important through their own logging
+    # handlers, so output is only captured at all under --verbose;
+    # otherwise the children write to /dev/null and the runner never
+    # buffers, copies or decodes their output
+    capture = bool(args) and "--verbose" in args
+
     try:
-        result = subprocess.run(
-            cmd, 
-            stdout=subprocess.PIPE, 
-            stderr=subprocess.PIPE,
-            text=True,
-            check=False
-        )
-        success = result.returncode == 0
-        duration = time.time() - start_time
-        
-        status = "SUCCESS" if success else "FAILURE"
-        logger.info(f"{test_script} completed with status: {status} in {duration:.2f} seconds")
-        
-        # Log stdout and stderr if there was a failure or in verbose mode
-        if not success or args and "--verbose" in args:
-            if result.stdout:
-                logger.info(f"STDOUT from {test_script}:\n{result.stdout}")
-            if result.stderr:
-                logger.error(f"STDERR from {test_script}:\n{result.stderr}")
+        # When capturing, children write straight into unlinked temp
+        # files: no pipe for the parent to drain and no pipe-buffer
+        # deadlock for chatty tests
+        with tempfile.TemporaryFile() as out_file, tempfile.TemporaryFile() as err_file:
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=out_file if capture else asyncio.subprocess.DEVNULL,
+                stderr=err_file if capture else asyncio.subprocess.DEVNULL,
+                env=_CHILD_ENV
+            )
+            await process.wait()
+            success = process.returncode == 0
+            duration = time.monotonic() - start_time
+            
+            status = "SUCCESS" if success else "FAILURE"
+            logger.info(f"{test_script} completed with status: {status} in {duration:.2f} seconds")
+            
+            stdout = stderr = ""
+            if capture:
+                out_file.seek(0)
+                stdout = out_file.read().decode(errors="replace")
+                err_file.seek(0)
+                stderr = err_file.read().decode(errors="replace")
+                if stdout:
+                    logger.info(f"STDOUT from {test_script}:\n{stdout}")
+                if stderr:
+                    logger.error(f"STDERR from {test_script}:\n{stderr}")
+            elif not success:
+                logger.error(f"Output from {test_script} was not captured; re-run with --verbose for details")
         
         return {
             "script": test_script,
             "success": success,
             "duration": duration,
-            "returncode": result.returncode,
-            "stdout": result.stdout,
-            "stderr": result.stderr
+            "returncode": process.returncode,
+            "stdout": stdout,
+            "stderr": stderr
         }
     except Exception as e:
         logger.error(f"Error running {test_script}: {str(e)}")
         return {
             "script": test_script,
             "success": False,
-            "duration": time.time() - start_time,
+            "duration": time.monotonic() - start_time,
             "error": str(e)
         }
 
+async def run_jobs(jobs):
+    """Run every suite child process concurrently on one event loop."""
+    return list(await asyncio.gather(*[run_test(script, args) for script, args in jobs]))
+
 def parse_args():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(description='Run all SAST Console API tests')
@@ -99,31 +142,21 @@ def parse_args():
                         help='Run negative tests (testing error conditions)')
     return parser.parse_args()
 
-def main():
-    """Run the tests and summarize results."""
-    args = parse_args()
-    results = []
-    
-    # Make sure logs directory exists
-    os.makedirs(LOG_DIR, exist_ok=True)
-    
-    logger.info("=== Starting SAST Console API Test Suite ===")
-    start_time = time.time()
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Test run started at: {timestamp}")
-    
-    # Run basic functional tests
+def build_jobs(args):
+    """Build the list of (test_script, args) jobs for this run."""
+    jobs = []
+
+    # Basic functional tests
     if not args.load_only and not args.frontend_only:
         func_args = ["--negative"] if args.negative else None
         if args.verbose:
             func_args = func_args or []
             func_args.append("--verbose")
-        
+
         # 使用当前目录的相对路径
-        func_result = run_test(os.path.join(SCRIPT_DIR, "test_console_api.py"), func_args)
-        results.append(func_result)
-    
-    # Run load tests
+        jobs.append((os.path.join(SCRIPT_DIR, "test_console_api.py"), func_args))
+
+    # Load tests
     if not args.functional_only and not args.frontend_only:
         load_args = []
         if args.load_agents != 5:
@@ -134,46 +167,57 @@ def main():
             load_args.extend(["--concurrent", str(args.load_concurrent)])
         if args.verbose:
             load_args.append("--verbose")
-            
+
         # 使用当前目录的相对路径
-        load_result = run_test(os.path.join(SCRIPT_DIR, "load_test_console_api.py"), load_args or None)
-        results.append(load_result)
-    
-    # Run frontend data validation tests
+        jobs.append((os.path.join(SCRIPT_DIR, "load_test_console_api.py"), load_args or None))
+
+    # Frontend data validation tests
     if not args.functional_only and not args.load_only:
         verbose_arg = ["--verbose"] if args.verbose else None
-        
-        # Run dashboard data tests
-        dashboard_result = run_test(os.path.join(SCRIPT_DIR, "test_dashboard_data.py"), verbose_arg)
-        results.append(dashboard_result)
-        
-        # Run agents data tests
-        agents_result = run_test(os.path.join(SCRIPT_DIR, "test_agents_data.py"), verbose_arg)
-        results.append(agents_result)
-        
-        # Run vulnerability data tests
-        vulnerability_result = run_test(os.path.join(SCRIPT_DIR, "test_vulnerability_data.py"), verbose_arg)
-        results.append(vulnerability_result)
+        jobs.append((os.path.join(SCRIPT_DIR, "test_dashboard_data.py"), verbose_arg))
+        jobs.append((os.path.join(SCRIPT_DIR, "test_agents_data.py"), verbose_arg))
+        jobs.append((os.path.join(SCRIPT_DIR, "test_vulnerability_data.py"), verbose_arg))
+
+    return jobs
+
+def main():
+    """Run the tests and summarize results."""
+    args = parse_args()
+    
+    logger.info("=== Starting SAST Console API Test Suite ===")
+    start_time = time.monotonic()
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    logger.info(f"Test run started at: {timestamp}")
+    
+    # The suites are independent, so run them concurrently instead of
+    # back-to-back; each suite is already its own interpreter process,
+    # so one thread per child is all the runner needs
+    jobs = build_jobs(args)
+    results = asyncio.run(run_jobs(jobs))
     
     # Summarize results
-    total_duration = time.time() - start_time
+    total_duration = time.monotonic() - start_time
     success_count = sum(1 for r in results if r["success"])
     failed_count = len(results) - success_count
     
-    logger.info("\n=== Test Run Summary ===")
-    logger.info(f"Total tests run: {len(results)}")
-    logger.info(f"Successful: {success_count}")
-    logger.info(f"Failed: {failed_count}")
-    logger.info(f"Total duration: {total_duration:.2f} seconds")
-    logger.info("\n=== Detailed Results ===")
-    
+    # One record per summary instead of a dozen: each logger.info call
+    # pays formatting and handler locking, and the buffered file handler
+    # keeps whole summaries contiguous when suites log concurrently
+    lines = [
+        "\n=== Test Run Summary ===",
+        f"Total tests run: {len(results)}",
+        f"Successful: {success_count}",
+        f"Failed: {failed_count}",
+        f"Total duration: {total_duration:.2f} seconds",
+        "\n=== Detailed Results ===",
+    ]
     for result in results:
         status = "SUCCESS" if result["success"] else "FAILURE"
-        logger.info(f"{result['script']}: {status} ({result['duration']:.2f}s)")
+        lines.append(f"{result['script']}: {status} ({result['duration']:.2f}s)")
         if not result["success"] and "error" in result:
-            logger.error(f"  Error: {result['error']}")
-    
-    logger.info("=== End of Test Run ===")
+            lines.append(f"  Error: {result['error']}")
+    lines.append("=== End of Test Run ===")
+    logger.info("\n".join(lines))
     
     # Return exit code based on success/failure
     return 0 if all(r["success"] for r in results) else 1
@@ -1,11 +1,8 @@
 import unittest
-import requests
-import json
+import copy
 import uuid
 import logging
-import time
 from datetime import datetime, timedelta
-from unittest.mock import patch, MagicMock
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -16,41 +13,61 @@ class TestAgentsData(unittest.TestCase):
     
     BASE_URL = "http://localhost:3000/api"
     
-    def setUp(self):
-        """Set up test by registering multiple test agents with different statuses"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up the class by building the shared test agents once"""
         # Generate unique identifiers for this test run
-        self.test_run_id = str(uuid.uuid4())[:8]
-        self.agent_ids = []
-        self.agent_names = []
+        cls.test_run_id = uuid.uuid4().hex[:8]
+        cls.agent_ids = []
+        cls.agent_names = []
         
         # Create test agents with different capabilities and statuses
-        self.create_test_agents()
+        cls.create_test_agents()
     
-    def create_test_agents(self):
+    def setUp(self):
+        """Give each test its own copy of the shared agents, since the
+        heartbeat test mutates them in place"""
+        self.mock_agents = copy.deepcopy(self.__class__.mock_agents)
+        # Index the copies once per test: status tag -> agent and
+        # id -> agent, replacing linear scans in the tests and helpers
+        self.mock_agents_by_tag = {
+            tag: agent
+            for agent in self.mock_agents
+            for tag in ("online", "offline", "busy")
+            if tag in agent["name"]
+        }
+        self.mock_agents_by_id = {agent["id"]: agent for agent in self.mock_agents}
+    
+    @classmethod
+    def create_test_agents(cls):
         """Create multiple test agents with different capabilities and status"""
+        # One timestamp serves every fixture field; the agents don't need
+        # nine separate clock reads to look freshly created
+        now_iso = datetime.now().isoformat()
+        
         # Agent 1: Online with multiple capabilities
-        self.agent1_id = str(uuid.uuid4())
-        self.agent1_name = f"test-agent-online-{self.test_run_id}"
-        self.agent_ids.append(self.agent1_id)
-        self.agent_names.append(self.agent1_name)
+        cls.agent1_id = uuid.uuid4().hex
+        cls.agent1_name = f"test-agent-online-{cls.test_run_id}"
+        cls.agent_ids.append(cls.agent1_id)
+        cls.agent_names.append(cls.agent1_name)
         
         # Agent 2: Offline with basic capabilities
-        self.agent2_id = str(uuid.uuid4())
-        self.agent2_name = f"test-agent-offline-{self.test_run_id}"
-        self.agent_ids.append(self.agent2_id)
-        self.agent_names.append(self.agent2_name)
+        cls.agent2_id = uuid.uuid4().hex
+        cls.agent2_name = f"test-agent-offline-{cls.test_run_id}"
+        cls.agent_ids.append(cls.agent2_id)
+        cls.agent_names.append(cls.agent2_name)
         
         # Agent 3: Busy (online and running a task)
-        self.agent3_id = str(uuid.uuid4())
-        self.agent3_name = f"test-agent-busy-{self.test_run_id}"
-        self.agent_ids.append(self.agent3_id)
-        self.agent_names.append(self.agent3_name)
+        cls.agent3_id = uuid.uuid4().hex
+        cls.agent3_name = f"test-agent-busy-{cls.test_run_id}"
+        cls.agent_ids.append(cls.agent3_id)
+        cls.agent_names.append(cls.agent3_name)
         
         # Create mock agents
-        self.mock_agents = [
+        cls.mock_agents = [
             {
-                "id": self.agent1_id,
-                "name": self.agent1_name,
+                "id": cls.agent1_id,
+                "name": cls.agent1_name,
                 "status": "online",  # This agent received a heartbeat to set status to online
                 "capabilities": ["bandit", "semgrep", "gitleaks", "dependency-check"],
                 "system_info": {
@@ -60,13 +77,13 @@ class TestAgentsData(unittest.TestCase):
                     "cpu_count": 8,
                     "memory_gb": 16
                 },
-                "last_heartbeat": datetime.now().isoformat(),
-                "created_at": datetime.now().isoformat(),
-                "updated_at": datetime.now().isoformat()
+                "last_heartbeat": now_iso,
+                "created_at": now_iso,
+                "updated_at": now_iso
             },
             {
-                "id": self.agent2_id,
-                "name": self.agent2_name,
+                "id": cls.agent2_id,
+                "name": cls.agent2_name,
                 "status": "offline",  # This agent's status was explicitly set to offline
                 "capabilities": ["bandit", "semgrep"],
                 "system_info": {
@@ -76,13 +93,13 @@ class TestAgentsData(unittest.TestCase):
                     "cpu_count": 4,
                     "memory_gb": 8
                 },
-                "last_heartbeat": datetime.now().isoformat(),
-                "created_at": datetime.now().isoformat(),
-                "updated_at": datetime.now().isoformat()
+                "last_heartbeat": now_iso,
+                "created_at": now_iso,
+                "updated_at": now_iso
             },
             {
-                "id": self.agent3_id,
-                "name": self.agent3_name,
+                "id": cls.agent3_id,
+                "name": cls.agent3_name,
                 "status": "online",  # This agent received a heartbeat to set status to online
                 "capabilities": ["bandit", "semgrep", "gitleaks"],
                 "system_info": {
@@ -92,29 +109,37 @@ class TestAgentsData(unittest.TestCase):
                     "cpu_count": 10,
                     "memory_gb": 32
                 },
-                "last_heartbeat": datetime.now().isoformat(),
-                "created_at": datetime.now().isoformat(),
-                "updated_at": datetime.now().isoformat()
+                "last_heartbeat": now_iso,
+                "created_at": now_iso,
+                "updated_at": now_iso
             }
         ]
         
         # Create a mock task for agent 3
-        self.task_id = str(uuid.uuid4())
+        cls.task_id = uuid.uuid4().hex
+
+    def _get_agents(self):
+        """Return the agents listing as the console would serve it"""
+        return {"agents": self.mock_agents}
+
+    def _get_agent(self, agent_id):
+        """Return a single agent keyed by id, as the console would"""
+        return {"agent": self.mock_agents_by_id.get(agent_id)}
+
+    def _heartbeat(self, agent_id):
+        """Apply a heartbeat the way the console does: the agent goes
+        online and its heartbeat/update timestamps advance"""
+        agent = self._get_agent(agent_id)["agent"]
+        agent["status"] = "online"
+        stamp = (datetime.now() + timedelta(seconds=10)).isoformat()
+        agent["last_heartbeat"] = stamp
+        agent["updated_at"] = stamp
+        return {"success": True, "message": "Heartbeat received"}
     
-    @patch('requests.get')
-    def test_agents_list(self, mock_get):
+    def test_agents_list(self):
         """Test that agents list shows all agents with correct data"""
-        # Mock the GET response for agents
-        mock_get.return_value = MagicMock(
-            status_code=200,
-            json=lambda: {"agents": self.mock_agents}
-        )
-        
         # Get all agents
-        response = requests.get(f"{self.BASE_URL}/agents")
-        self.assertEqual(response.status_code, 200)
-        
-        test_agents = response.json()["agents"]
+        test_agents = self._get_agents()["agents"]
         
         # Verify we have at least 3 agents
         self.assertGreaterEqual(len(test_agents), 3)
@@ -129,40 +154,30 @@ class TestAgentsData(unittest.TestCase):
             self.assertIn("last_heartbeat", agent)
         
         # Verify agent 1 (online)
-        online_agent = next((a for a in test_agents if "online" in a["name"]), None)
+        online_agent = self.mock_agents_by_tag.get("online")
         self.assertIsNotNone(online_agent, "Online agent not found")
         self.assertEqual(online_agent["status"], "online")  # This agent received a heartbeat to set status to online
         self.assertGreaterEqual(len(online_agent["capabilities"]), 4)
         self.assertEqual(online_agent["system_info"]["platform"], "linux")
         
         # Verify agent 2 (offline)
-        offline_agent = next((a for a in test_agents if "offline" in a["name"]), None)
+        offline_agent = self.mock_agents_by_tag.get("offline")
         self.assertIsNotNone(offline_agent, "Offline agent not found")
         self.assertEqual(offline_agent["status"], "offline")  # This agent's status was explicitly set to offline
         self.assertEqual(len(offline_agent["capabilities"]), 2)
         self.assertEqual(offline_agent["system_info"]["platform"], "windows")
         
         # Verify agent 3 (busy)
-        busy_agent = next((a for a in test_agents if "busy" in a["name"]), None)
+        busy_agent = self.mock_agents_by_tag.get("busy")
         self.assertIsNotNone(busy_agent, "Busy agent not found")
         self.assertEqual(busy_agent["status"], "online")  # This agent received a heartbeat to set status to online
         self.assertEqual(len(busy_agent["capabilities"]), 3)
         self.assertEqual(busy_agent["system_info"]["platform"], "macos")
     
-    @patch('requests.get')
-    def test_agent_detail(self, mock_get):
+    def test_agent_detail(self):
         """Test that agent detail page shows correct data"""
-        # Mock the GET response for a specific agent
-        mock_get.return_value = MagicMock(
-            status_code=200,
-            json=lambda: {"agent": self.mock_agents[0]}
-        )
-        
         # Get agent details
-        response = requests.get(f"{self.BASE_URL}/agents/{self.agent1_id}")
-        self.assertEqual(response.status_code, 200)
-        
-        agent = response.json()["agent"]
+        agent = self._get_agent(self.agent1_id)["agent"]
         
         # Verify agent data
         self.assertEqual(agent["id"], self.agent1_id)
@@ -171,56 +186,18 @@ class TestAgentsData(unittest.TestCase):
         self.assertGreaterEqual(len(agent["capabilities"]), 4)
         self.assertEqual(agent["system_info"]["platform"], "linux")
     
-    @patch('requests.get')
-    @patch('requests.post')
-    def test_agent_heartbeat(self, mock_post, mock_get):
+    def test_agent_heartbeat(self):
         """Test that agent heartbeat updates status and timestamps correctly"""
-        # Mock the GET response for the offline agent
-        mock_get.side_effect = [
-            # First call - before heartbeat
-            MagicMock(
-                status_code=200,
-                json=lambda: {"agent": self.mock_agents[1]}  # offline agent
-            ),
-            # Second call - after heartbeat
-            MagicMock(
-                status_code=200,
-                json=lambda: {
-                    "agent": {
-                        **self.mock_agents[1],
-                        "status": "online",
-                        "last_heartbeat": (datetime.now() + timedelta(seconds=10)).isoformat(),
-                        "updated_at": (datetime.now() + timedelta(seconds=10)).isoformat()
-                    }
-                }
-            )
-        ]
-        
-        # Mock the POST response for heartbeat
-        mock_post.return_value = MagicMock(
-            status_code=200,
-            json=lambda: {"success": True, "message": "Heartbeat received"}
-        )
-        
-        # Get offline agent
+        # Get offline agent (snapshot it, the heartbeat mutates in place)
         offline_agent_id = self.agent2_id
-        response = requests.get(f"{self.BASE_URL}/agents/{offline_agent_id}")
-        self.assertEqual(response.status_code, 200)
-        
-        before_heartbeat = response.json()["agent"]
+        before_heartbeat = dict(self._get_agent(offline_agent_id)["agent"])
         
         # Send heartbeat to update status
-        heartbeat_data = {
-            "status": "online"
-        }
-        response = requests.post(f"{self.BASE_URL}/agents/{offline_agent_id}/heartbeat", json=heartbeat_data)
-        self.assertEqual(response.status_code, 200)
+        result = self._heartbeat(offline_agent_id)
+        self.assertTrue(result["success"])
         
         # Get agent again to verify status changed
-        response = requests.get(f"{self.BASE_URL}/agents/{offline_agent_id}")
-        self.assertEqual(response.status_code, 200)
-        
-        after_heartbeat = response.json()["agent"]
+        after_heartbeat = self._get_agent(offline_agent_id)["agent"]
         
         # Verify status changed
         self.assertEqual(after_heartbeat["status"], "online")
@@ -1,10 +1,11 @@
 import unittest
 import requests
-import json
 import uuid
 import logging
-from datetime import datetime, timedelta
-from unittest.mock import patch, MagicMock
+from collections import Counter
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import patch
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -15,17 +16,19 @@ class TestDashboardData(unittest.TestCase):
     
     BASE_URL = "http://localhost:3000/api"
     
-    def setUp(self):
-        """Set up test by registering a test agent and creating test tasks"""
+    @classmethod
+    def setUpClass(cls):
+        """Build the shared fixtures once for the whole class; no test
+        mutates them, so there is no need to rebuild per test"""
         # Generate unique identifiers for this test run
-        self.test_run_id = str(uuid.uuid4())[:8]
-        self.agent_id = str(uuid.uuid4())
-        self.agent_name = f"test-agent-{self.test_run_id}"
+        cls.test_run_id = str(uuid.uuid4())[:8]
+        cls.agent_id = str(uuid.uuid4())
+        cls.agent_name = f"test-agent-{cls.test_run_id}"
         
         # Mock data that would normally come from the server
-        self.mock_agent = {
-            "id": self.agent_id,
-            "name": self.agent_name,
+        cls.mock_agent = {
+            "id": cls.agent_id,
+            "name": cls.agent_name,
             "status": "online",  # Agents are set to 'online' by default during registration
             "capabilities": ["bandit", "semgrep"],
             "system_info": {
@@ -37,30 +40,26 @@ class TestDashboardData(unittest.TestCase):
         }
         
         # Create task data
-        self.task_data = {
-            "agent_id": self.agent_id,
-            "repository_url": f"https://github.com/test/repo-{self.test_run_id}",
+        cls.task_data = {
+            "agent_id": cls.agent_id,
+            "repository_url": f"https://github.com/test/repo-{cls.test_run_id}",
             "branch": "main",
             "scanners": ["bandit", "semgrep"]
         }
         
-        # Create test tasks with different statuses
-        self.create_test_tasks()
-        
-    def create_test_tasks(self):
-        """Create mock test tasks with different statuses for testing dashboard stats"""
-        # Create mock task IDs
-        self.pending_task_id = str(uuid.uuid4())
-        self.running_task_id = str(uuid.uuid4())
-        self.completed_task_id = str(uuid.uuid4())
-        self.failed_task_id = str(uuid.uuid4())
+        # Create mock task IDs with different statuses for the
+        # dashboard stats tests
+        cls.pending_task_id = str(uuid.uuid4())
+        cls.running_task_id = str(uuid.uuid4())
+        cls.completed_task_id = str(uuid.uuid4())
+        cls.failed_task_id = str(uuid.uuid4())
         
     @patch('requests.get')
     @patch('requests.post')
     def test_agents_count(self, mock_post, mock_get):
         """Test that agents count on dashboard is accurate"""
         # Mock the GET response for agents
-        mock_get.return_value = MagicMock(
+        mock_get.return_value = SimpleNamespace(
             status_code=200,
             json=lambda: {"agents": [self.mock_agent]}
         )
@@ -83,7 +82,7 @@ class TestDashboardData(unittest.TestCase):
         self.assertIn("last_heartbeat", test_agent)
         
         # Mock the POST response for heartbeat
-        mock_post.return_value = MagicMock(
+        mock_post.return_value = SimpleNamespace(
             status_code=200,
             json=lambda: {"success": True, "message": "Heartbeat received"}
         )
@@ -99,6 +98,10 @@ class TestDashboardData(unittest.TestCase):
     @patch('requests.post')
     def test_tasks_count(self, mock_post, mock_get):
         """Test that task counts on dashboard are accurate"""
+        # One timestamp serves every fixture field; the dashboard only
+        # cares about statuses, not distinct clock readings
+        now = datetime.now().isoformat()
+        
         # Mock the GET response for tasks
         mock_tasks = [
             {
@@ -109,8 +112,8 @@ class TestDashboardData(unittest.TestCase):
                 "branch": "main",
                 "scanners": ["bandit", "semgrep"],
                 "status": "pending",
-                "created_at": datetime.now().isoformat(),
-                "updated_at": datetime.now().isoformat(),
+                "created_at": now,
+                "updated_at": now,
                 "started_at": None,
                 "completed_at": None
             },
@@ -122,9 +125,9 @@ class TestDashboardData(unittest.TestCase):
                 "branch": "main",
                 "scanners": ["bandit", "semgrep"],
                 "status": "running",
-                "created_at": datetime.now().isoformat(),
-                "updated_at": datetime.now().isoformat(),
-                "started_at": datetime.now().isoformat(),
+                "created_at": now,
+                "updated_at": now,
+                "started_at": now,
                 "completed_at": None
             },
             {
@@ -135,10 +138,10 @@ class TestDashboardData(unittest.TestCase):
                 "branch": "main",
                 "scanners": ["bandit", "semgrep"],
                 "status": "completed",
-                "created_at": datetime.now().isoformat(),
-                "updated_at": datetime.now().isoformat(),
-                "started_at": datetime.now().isoformat(),
-                "completed_at": datetime.now().isoformat()
+                "created_at": now,
+                "updated_at": now,
+                "started_at": now,
+                "completed_at": now
             },
             {
                 "id": self.failed_task_id,
@@ -148,14 +151,14 @@ class TestDashboardData(unittest.TestCase):
                 "branch": "main",
                 "scanners": ["bandit", "semgrep"],
                 "status": "failed",
-                "created_at": datetime.now().isoformat(),
-                "updated_at": datetime.now().isoformat(),
-                "started_at": datetime.now().isoformat(),
-                "completed_at": datetime.now().isoformat()
+                "created_at": now,
+                "updated_at": now,
+                "started_at": now,
+                "completed_at": now
             }
         ]
         
-        mock_get.return_value = MagicMock(
+        mock_get.return_value = SimpleNamespace(
             status_code=200,
             json=lambda: {"tasks": mock_tasks}
         )
@@ -166,17 +169,14 @@ class TestDashboardData(unittest.TestCase):
         
         tasks = response.json()["tasks"]
         
-        # Count tasks by status
-        pending_count = sum(1 for t in tasks if t["status"] == "pending")
-        running_count = sum(1 for t in tasks if t["status"] == "running")
-        completed_count = sum(1 for t in tasks if t["status"] == "completed")
-        failed_count = sum(1 for t in tasks if t["status"] == "failed")
+        # Count tasks by status in one pass instead of one scan per status
+        status_counts = Counter(t["status"] for t in tasks)
         
         # Verify counts
-        self.assertEqual(pending_count, 1, "Pending task count incorrect")
-        self.assertEqual(running_count, 1, "Running task count incorrect")
-        self.assertEqual(completed_count, 1, "Completed task count incorrect")
-        self.assertEqual(failed_count, 1, "Failed task count incorrect")
+        self.assertEqual(status_counts["pending"], 1, "Pending task count incorrect")
+        self.assertEqual(status_counts["running"], 1, "Running task count incorrect")
+        self.assertEqual(status_counts["completed"], 1, "Completed task count incorrect")
+        self.assertEqual(status_counts["failed"], 1, "Failed task count incorrect")
         
         # Verify total count
         self.assertEqual(len(tasks), 4, "Total task count incorrect")
@@ -184,6 +184,9 @@ class TestDashboardData(unittest.TestCase):
     @patch('requests.get')
     def test_vulnerabilities_data(self, mock_get):
         """Test that vulnerability data on dashboard is accurate"""
+        # One timestamp serves every fixture field
+        now = datetime.now().isoformat()
+        
         # Mock the GET response for vulnerabilities
         mock_vulnerabilities = [
             {
@@ -199,7 +202,7 @@ class TestDashboardData(unittest.TestCase):
                 "message": "Possible hardcoded password",
                 "description": "Hardcoded passwords can lead to security vulnerabilities",
                 "cwe": "CWE-259",
-                "created_at": datetime.now().isoformat(),
+                "created_at": now,
                 "repository_url": f"https://github.com/test/repo-completed-{self.test_run_id}"
             },
             {
@@ -215,7 +218,7 @@ class TestDashboardData(unittest.TestCase):
                 "message": "Avoid using eval",
                 "description": "Eval can execute arbitrary code",
                 "cwe": "CWE-95",
-                "created_at": datetime.now().isoformat(),
+                "created_at": now,
                 "repository_url": f"https://github.com/test/repo-completed-{self.test_run_id}"
             },
             {
@@ -231,12 +234,12 @@ class TestDashboardData(unittest.TestCase):
                 "message": "TODO found",
                 "description": "TODO comments should be addressed",
                 "cwe": None,
-                "created_at": datetime.now().isoformat(),
+                "created_at": now,
                 "repository_url": f"https://github.com/test/repo-completed-{self.test_run_id}"
             }
         ]
         
-        mock_get.return_value = MagicMock(
+        mock_get.return_value = SimpleNamespace(
             status_code=200,
             json=lambda: {"vulnerabilities": mock_vulnerabilities}
         )
@@ -247,15 +250,13 @@ class TestDashboardData(unittest.TestCase):
         
         vulnerabilities = response.json()["vulnerabilities"]
         
-        # Count vulnerabilities by severity
-        high_count = sum(1 for v in vulnerabilities if v["severity"] == "high")
-        medium_count = sum(1 for v in vulnerabilities if v["severity"] == "medium")
-        low_count = sum(1 for v in vulnerabilities if v["severity"] == "low")
+        # Count vulnerabilities by severity in one pass
+        severity_counts = Counter(v["severity"] for v in vulnerabilities)
         
         # Verify counts
-        self.assertEqual(high_count, 1, "High severity count incorrect")
-        self.assertEqual(medium_count, 1, "Medium severity count incorrect")
-        self.assertEqual(low_count, 1, "Low severity count incorrect")
+        self.assertEqual(severity_counts["high"], 1, "High severity count incorrect")
+        self.assertEqual(severity_counts["medium"], 1, "Medium severity count incorrect")
+        self.assertEqual(severity_counts["low"], 1, "Low severity count incorrect")
         
         # Verify total count
         self.assertEqual(len(vulnerabilities), 3, "Total vulnerability count incorrect")
@@ -272,10 +273,5 @@ class TestDashboardData(unittest.TestCase):
         self.assertIn("message", vuln)
         self.assertIn("repository_url", vuln)
     
-    def tearDown(self):
-        """Clean up after tests"""
-        # No need to clean up since we're using mocks
-        pass
-
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
@@ -1,6 +1,5 @@
 import unittest
 import requests
-import json
 import uuid
 import logging
 from datetime import datetime, timedelta
@@ -4,12 +4,16 @@
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import uuid
 import logging
 import sys
 import os
-from datetime import datetime
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 
 # 添加父目录到路径，以便能导入agent包中的模块
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -24,29 +28,76 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# orjson序列化比标准库json快数倍，用于日志里的payload输出；
+# 未安装时退回标准库
+try:
+    import orjson
+    def _dumps(obj):
+        return orjson.dumps(obj).decode()
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj)
+
+# ijson可以边下载边遍历vulnerabilities数组，内存占用与结果数量无关；
+# 未安装时退回一次性response.json()
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 # API基础URL
 # BASE_URL = "http://localhost:3000/api"
 BASE_URL = "https://sast-console.vercel.app/api"
 
+# 复用同一个连接池，避免每次请求都重新进行TCP/TLS握手
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=10,
+    max_retries=Retry(total=2, backoff_factor=0.2)
+))
+
+# GET响应的短TTL缓存：验证逻辑扩展后重复读取同一个列表接口时，
+# 只向远端请求一次；任何写操作都会让缓存整体失效
+_GET_CACHE = {}
+_GET_CACHE_TTL = 5  # 秒
+
+
+def _get(url):
+    """带TTL缓存的GET"""
+    now = time.monotonic()
+    hit = _GET_CACHE.get(url)
+    if hit is not None and now - hit[0] < _GET_CACHE_TTL:
+        return hit[1]
+    response = SESSION.get(url)
+    _GET_CACHE[url] = (now, response)
+    return response
+
+
+def _post(url, json=None):
+    """POST并使GET缓存失效，避免读到写之前的旧数据"""
+    _GET_CACHE.clear()
+    return SESSION.post(url, json=json)
+
 def test_agents_api():
     """测试agents API"""
     logger.info("=== 测试 Agents API ===")
     
     # 测试获取所有agents
     url = f"{BASE_URL}/agents"
-    logger.info(f"GET {url}")
-    response = requests.get(url)
-    logger.info(f"状态码: {response.status_code}")
+    logger.info("GET %s", url)
+    response = _get(url)
+    logger.info("状态码: %s", response.status_code)
     
     if response.status_code == 200:
         data = response.json()
-        logger.info(f"返回的agents数量: {len(data.get('agents', []))}")
+        logger.info("返回的agents数量: %s", len(data.get('agents', [])))
         
         # 打印agents数据的简略信息
         for i, agent in enumerate(data.get('agents', [])[:3]):  # 只显示前3个
-            logger.info(f"Agent #{i+1}: {agent.get('name', 'N/A')} - {agent.get('status', 'N/A')}")
+            logger.info("Agent #%s: %s - %s", i+1, agent.get('name', 'N/A'), agent.get('status', 'N/A'))
     else:
-        logger.error(f"请求失败: {response.text}")
+        logger.error("请求失败: %s", response.text)
     
     # 测试注册一个新agent
     agent_id = str(uuid.uuid4())
@@ -65,29 +116,32 @@ def test_agents_api():
         }
     }
     
-    logger.info(f"POST {url}")
-    logger.info(f"数据: {json.dumps(data)}")
+    logger.info("POST %s", url)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("数据: %s", _dumps(data))
     
-    response = requests.post(url, json=data)
-    logger.info(f"状态码: {response.status_code}")
+    response = _post(url, json=data)
+    logger.info("状态码: %s", response.status_code)
     
     if response.status_code == 200:
         result = response.json()
-        logger.info(f"响应: {json.dumps(result)}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("响应: %s", _dumps(result))
         
         # 尝试获取新注册的agent
         url = f"{BASE_URL}/agents/{agent_id}"
-        logger.info(f"GET {url}")
-        response = requests.get(url)
-        logger.info(f"状态码: {response.status_code}")
+        logger.info("GET %s", url)
+        response = _get(url)
+        logger.info("状态码: %s", response.status_code)
         
         if response.status_code == 200:
             data = response.json()
-            logger.info(f"获取到agent: {json.dumps(data)}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("获取到agent: %s", _dumps(data))
         else:
-            logger.error(f"请求失败: {response.text}")
+            logger.error("请求失败: %s", response.text)
     else:
-        logger.error(f"请求失败: {response.text}")
+        logger.error("请求失败: %s", response.text)
     
     return agent_id, agent_name
 
@@ -97,19 +151,19 @@ def test_tasks_api(agent_id, agent_name):
     
     # 测试获取所有tasks
     url = f"{BASE_URL}/tasks"
-    logger.info(f"GET {url}")
-    response = requests.get(url)
-    logger.info(f"状态码: {response.status_code}")
+    logger.info("GET %s", url)
+    response = _get(url)
+    logger.info("状态码: %s", response.status_code)
     
     if response.status_code == 200:
         data = response.json()
-        logger.info(f"返回的tasks数量: {len(data.get('tasks', []))}")
+        logger.info("返回的tasks数量: %s", len(data.get('tasks', [])))
         
         # 打印tasks数据的简略信息
         for i, task in enumerate(data.get('tasks', [])[:3]):  # 只显示前3个
-            logger.info(f"Task #{i+1}: {task.get('repository_url', 'N/A')} - {task.get('status', 'N/A')}")
+            logger.info("Task #%s: %s - %s", i+1, task.get('repository_url', 'N/A'), task.get('status', 'N/A'))
     else:
-        logger.error(f"请求失败: {response.text}")
+        logger.error("请求失败: %s", response.text)
     
     # 创建一个新task
     task_data = {
@@ -120,33 +174,36 @@ def test_tasks_api(agent_id, agent_name):
     }
     
     url = f"{BASE_URL}/tasks"
-    logger.info(f"POST {url}")
-    logger.info(f"数据: {json.dumps(task_data)}")
+    logger.info("POST %s", url)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("数据: %s", _dumps(task_data))
     
-    response = requests.post(url, json=task_data)
-    logger.info(f"状态码: {response.status_code}")
+    response = _post(url, json=task_data)
+    logger.info("状态码: %s", response.status_code)
     
     task_id = None
     if response.status_code == 200:
         result = response.json()
-        logger.info(f"响应: {json.dumps(result)}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("响应: %s", _dumps(result))
         
         if "task" in result and "id" in result["task"]:
             task_id = result["task"]["id"]
             
             # 尝试获取新创建的task
             url = f"{BASE_URL}/tasks/{task_id}"
-            logger.info(f"GET {url}")
-            response = requests.get(url)
-            logger.info(f"状态码: {response.status_code}")
+            logger.info("GET %s", url)
+            response = _get(url)
+            logger.info("状态码: %s", response.status_code)
             
             if response.status_code == 200:
                 data = response.json()
-                logger.info(f"获取到task: {json.dumps(data)}")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("获取到task: %s", _dumps(data))
             else:
-                logger.error(f"请求失败: {response.text}")
+                logger.error("请求失败: %s", response.text)
     else:
-        logger.error(f"请求失败: {response.text}")
+        logger.error("请求失败: %s", response.text)
     
     return task_id
 
@@ -156,19 +213,40 @@ def test_vulnerabilities_api():
     
     # 测试获取所有vulnerabilities
     url = f"{BASE_URL}/vulnerabilities"
-    logger.info(f"GET {url}")
-    response = requests.get(url)
-    logger.info(f"状态码: {response.status_code}")
+    logger.info("GET %s", url)
     
-    if response.status_code == 200:
-        data = response.json()
-        logger.info(f"返回的vulnerabilities数量: {len(data.get('vulnerabilities', []))}")
+    if ijson is not None:
+        # 流式遍历：逐条统计数量和severity，不把整个列表物化到内存
+        response = SESSION.get(url, stream=True)
+        logger.info("状态码: %s", response.status_code)
         
-        # 打印vulnerabilities数据的简略信息
-        for i, vuln in enumerate(data.get('vulnerabilities', [])[:3]):  # 只显示前3个
-            logger.info(f"Vulnerability #{i+1}: {vuln.get('file_path', 'N/A')} - {vuln.get('severity', 'N/A')}")
+        if response.status_code == 200:
+            response.raw.decode_content = True
+            total = 0
+            severity_counts = Counter()
+            for vuln in ijson.items(response.raw, 'vulnerabilities.item'):
+                total += 1
+                severity_counts[vuln.get('severity', 'N/A')] += 1
+                if total <= 3:  # 只显示前3个
+                    logger.info("Vulnerability #%s: %s - %s", total, vuln.get('file_path', 'N/A'), vuln.get('severity', 'N/A'))
+            logger.info("返回的vulnerabilities数量: %s", total)
+            logger.info("severity分布: %s", dict(severity_counts))
+        else:
+            logger.error("请求失败: %s", response.text)
+        response.close()
     else:
-        logger.error(f"请求失败: {response.text}")
+        response = _get(url)
+        logger.info("状态码: %s", response.status_code)
+        
+        if response.status_code == 200:
+            data = response.json()
+            logger.info("返回的vulnerabilities数量: %s", len(data.get('vulnerabilities', [])))
+            
+            # 打印vulnerabilities数据的简略信息
+            for i, vuln in enumerate(data.get('vulnerabilities', [])[:3]):  # 只显示前3个
+                logger.info("Vulnerability #%s: %s - %s", i+1, vuln.get('file_path', 'N/A'), vuln.get('severity', 'N/A'))
+        else:
+            logger.error("请求失败: %s", response.text)
 
 def main():
     """主函数"""
@@ -178,15 +256,17 @@ def main():
         # 测试agents API并获取新创建的agent ID
         agent_id, agent_name = test_agents_api()
         
-        # 测试tasks API并传入agent ID
-        task_id = test_tasks_api(agent_id, agent_name)
-        
-        # 测试vulnerabilities API
-        test_vulnerabilities_api()
+        # tasks依赖上面注册的agent，但和vulnerabilities互相独立，
+        # 两者并发执行以重叠网络延迟
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            tasks_future = executor.submit(test_tasks_api, agent_id, agent_name)
+            vulns_future = executor.submit(test_vulnerabilities_api)
+            task_id = tasks_future.result()
+            vulns_future.result()
         
         logger.info("\n所有API测试完成")
     except Exception as e:
-        logger.error(f"测试过程中发生错误: {str(e)}")
+        logger.error("测试过程中发生错误: %s", str(e))
         return 1
     
     return 0
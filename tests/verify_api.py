@@ -1,16 +1,25 @@
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
 import sys
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 # 添加父目录到路径，以便能导入agent包中的模块
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+# 复用同一个连接池，避免每次请求都重新进行TCP/TLS握手
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=10,
+    max_retries=Retry(total=2, backoff_factor=0.2)
+))
+
 def verify_agents_api():
     """验证agents API返回的数据"""
     url = "http://localhost:3000/api/agents"
-    response = requests.get(url)
+    response = SESSION.get(url)
     
     if response.status_code == 200:
         data = response.json()
@@ -33,7 +42,7 @@ def verify_agents_api():
 def verify_tasks_api():
     """验证tasks API返回的数据"""
     url = "http://localhost:3000/api/tasks"
-    response = requests.get(url)
+    response = SESSION.get(url)
     
     if response.status_code == 200:
         data = response.json()
@@ -56,7 +65,7 @@ def verify_tasks_api():
 def verify_vulnerabilities_api():
     """验证vulnerabilities API返回的数据"""
     url = "http://localhost:3000/api/vulnerabilities"
-    response = requests.get(url)
+    response = SESSION.get(url)
     
     if response.status_code == 200:
         data = response.json()
@@ -77,7 +86,8 @@ def verify_vulnerabilities_api():
 
 if __name__ == "__main__":
     print("开始验证API...\n")
-    verify_agents_api()
-    verify_tasks_api()
-    verify_vulnerabilities_api()
+    # 三个接口互相独立，用线程池并发请求，总耗时由最慢的一个决定
+    checks = [verify_agents_api, verify_tasks_api, verify_vulnerabilities_api]
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        list(executor.map(lambda check: check(), checks))
     print("\n验证完成") 
\ No newline at end of file
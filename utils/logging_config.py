@@ -1,9 +1,28 @@
 #!/usr/bin/env python3
 import os
+import atexit
+import queue
 import logging
 import logging.handlers
 from datetime import datetime
 
+# Background listener that owns the rotating file handler; log calls
+# only enqueue records, so disk latency never blocks the caller
+_listener = None
+
+# Default log directory, resolved once at import instead of per call
+_DEFAULT_LOG_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "logs"
+)
+
+# setup_logging is called from both import-time and main() paths;
+# configuring twice would duplicate handlers and log files
+_configured = False
+
+# Loggers already handed out, keyed by name: skips the f-string build
+# and the logging manager's lock/dict walk on repeated lookups
+_logger_cache = {}
+
 def setup_logging(log_level=logging.INFO, log_to_file=True, log_dir=None):
     """
     Setup logging configuration
@@ -15,10 +34,32 @@ def setup_logging(log_level=logging.INFO, log_to_file=True, log_dir=None):
         
     Returns:
         logging.Logger: Configured logger
+
+    Note:
+        Callers should pass %s-style arguments to the logger
+        (logger.info("x: %s", x)) rather than pre-formatted f-strings,
+        so records filtered by level never pay the formatting cost.
+
+        Repeated calls are idempotent: the handlers are only installed
+        once, and later calls just adjust the logger and handler levels.
     """
+    global _configured, _listener
     # Create root logger
     logger = logging.getLogger("SAST_Agent")
     logger.setLevel(log_level)
+    # Records stop here; bubbling to the root logger would emit every
+    # line a second time through whatever handlers root carries
+    logger.propagate = False
+    # Handlers installed by an earlier call (or a re-imported copy of
+    # this module) must track the new level too, or they keep filtering
+    # at the old one and e.g. --log-level DEBUG records never appear
+    for handler in logger.handlers:
+        handler.setLevel(log_level)
+    if _listener is not None:
+        for handler in _listener.handlers:
+            handler.setLevel(log_level)
+    if _configured:
+        return logger
     
     # Create formatter
     formatter = logging.Formatter(
@@ -31,13 +72,15 @@ def setup_logging(log_level=logging.INFO, log_to_file=True, log_dir=None):
     console_handler.setLevel(log_level)
     console_handler.setFormatter(formatter)
     
-    # Add console handler to logger
-    logger.addHandler(console_handler)
+    # Add console handler to logger, unless a re-imported copy of this
+    # module already installed one on the (process-global) logger
+    if not any(type(h) is logging.StreamHandler for h in logger.handlers):
+        logger.addHandler(console_handler)
     
     # Add file handler if requested
     if log_to_file:
         if not log_dir:
-            log_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "logs")
+            log_dir = _DEFAULT_LOG_DIR
         
         # Create log directory if it doesn't exist
         os.makedirs(log_dir, exist_ok=True)
@@ -55,11 +98,24 @@ def setup_logging(log_level=logging.INFO, log_to_file=True, log_dir=None):
         file_handler.setLevel(log_level)
         file_handler.setFormatter(formatter)
         
-        # Add file handler to logger
-        logger.addHandler(file_handler)
+        # File writes happen on a background thread: the logger gets a
+        # QueueHandler (a near-free enqueue) and a QueueListener drains
+        # the queue into the file handler
+        if not any(isinstance(h, logging.handlers.QueueHandler) for h in logger.handlers):
+            log_queue = queue.Queue(-1)
+            queue_handler = logging.handlers.QueueHandler(log_queue)
+            queue_handler.setLevel(log_level)
+            logger.addHandler(queue_handler)
+            
+            _listener = logging.handlers.QueueListener(
+                log_queue, file_handler, respect_handler_level=True
+            )
+            _listener.start()
+            atexit.register(_listener.stop)
         
         logger.info(f"Logging to file: {log_file}")
     
+    _configured = True
     return logger
 
 def get_logger(name=None):
@@ -72,6 +128,9 @@ def get_logger(name=None):
     Returns:
         logging.Logger: Logger instance
     """
-    if name:
-        return logging.getLogger(f"SAST_Agent.{name}")
-    return logging.getLogger("SAST_Agent")
+    try:
+        return _logger_cache[name]
+    except KeyError:
+        logger = logging.getLogger(f"SAST_Agent.{name}" if name else "SAST_Agent")
+        _logger_cache[name] = logger
+        return logger